@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+from fix_api_errors import TARGET, fix_api_error_handlers
+from fix_fallback import fix_fallback_system
+from fix_indentation import fix_indentation
+from fix_final import fix_final
+
+def fix_all():
+    # Read once, run every fix in memory, write once
+    content = TARGET.read_text(encoding='utf-8')
+
+    for fix in (fix_api_error_handlers, fix_fallback_system, fix_indentation, fix_final):
+        content = fix(content)
+
+    TARGET.write_text(content, encoding='utf-8')
+
+    print("✅ Applied all fixes to services/groq_question_generator.py")
+
+if __name__ == "__main__":
+    fix_all()
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
+import re
+from pathlib import Path
 
-def fix_api_error_handlers():
-    # Read the file
-    with open('services/groq_question_generator.py', 'r', encoding='utf-8') as f:
-        content = f.read()
+TARGET = Path('services/groq_question_generator.py')
 
+def fix_api_error_handlers(content: str) -> str:
     # Replace API error handlers with fallback calls
     
     # 1. Replace rate limit error (429)
@@ -70,29 +70,39 @@ def fix_api_error_handlers():
             logger.info("🔄 Falling back to template-based question generation...")
             return self._get_fallback_aptitude_questions(topic_configs, time_per_question, job_title)'''
 
-    # Apply replacements
-    replacements_made = 0
-    
-    if old_rate_limit in content:
-        content = content.replace(old_rate_limit, new_rate_limit)
-        replacements_made += 1
-        print("✅ Updated rate limit handler")
-    
-    if old_api_error in content:
-        content = content.replace(old_api_error, new_api_error)
-        replacements_made += 1
-        print("✅ Updated API error handler")
-    
-    if old_no_key in content:
-        content = content.replace(old_no_key, new_no_key)
-        replacements_made += 1
-        print("✅ Updated no API key handler")
+    # Apply all replacements in a single scan over the file
+    replacements = {
+        old_rate_limit: (new_rate_limit, "rate limit handler"),
+        old_api_error: (new_api_error, "API error handler"),
+        old_no_key: (new_no_key, "no API key handler"),
+    }
 
-    # Write the updated content
-    with open('services/groq_question_generator.py', 'w', encoding='utf-8') as f:
-        f.write(content)
+    # Short literals unique to each block - skip blocks whose anchor is absent
+    anchors = {
+        old_rate_limit: "'type': 'all_keys_rate_limited'",
+        old_api_error: "'type': 'api_error'",
+        old_no_key: "'type': 'aptitude_error'",
+    }
+    candidates = [old for old in replacements if anchors[old] in content]
+    matched = set()
+
+    def _swap(match):
+        matched.add(match.group(0))
+        return replacements[match.group(0)][0]
+
+    if candidates:
+        pattern = re.compile('|'.join(map(re.escape, candidates)))
+        content = pattern.sub(_swap, content)
+
+    replacements_made = 0
+    for old, (_, label) in replacements.items():
+        if old in matched:
+            replacements_made += 1
+            print(f"✅ Updated {label}")
 
     print(f'✅ Successfully updated {replacements_made} error handlers to use fallback system!')
+    return content
 
 if __name__ == "__main__":
-    fix_api_error_handlers()
+    content = fix_api_error_handlers(TARGET.read_text(encoding='utf-8'))
+    TARGET.write_text(content, encoding='utf-8')
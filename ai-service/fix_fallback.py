@@ -1,33 +1,13 @@
 #!/usr/bin/env python3
-import re
+from pathlib import Path
 
-def fix_fallback_system():
-    # Read the original file
-    with open('services/groq_question_generator.py', 'r', encoding='utf-8') as f:
-        content = f.read()
+TARGET = Path('services/groq_question_generator.py')
 
-    # Read the fallback method from the separate file
-    with open('services/aptitude_fallback.py', 'r', encoding='utf-8') as f:
-        fallback_content = f.read()
+def fix_fallback_system(content: str) -> str:
+    # Read the fallback method (a thin wrapper around services/aptitude_fallback.py)
+    fallback_content = Path(__file__).with_name('_fallback_method_template.txt').read_text(encoding='utf-8')
 
     # Replace the exception handler to use fallback
-    old_exception_pattern = r'''        except Exception as e:
-            logger\.error\(f"❌ Error generating aptitude questions: \{str\(e\)\}"\)
-            return \{
-                'success': False,
-                'questions': \[\{
-                    'topic': 'error',
-                    'question': f'ERROR: AI generation error\. \{str\(e\)\}',
-                    'options': \{'A': 'ERROR', 'B': 'AI error', 'C': 'occurred', 'D': 'during generation'\},
-                    'correct_answer': 'A',
-                    'difficulty': 'error',
-                    'time_limit': 60,
-                    'error': True
-                \}\],
-                'total_questions': 1,
-                'metadata': \{'generated_by': 'error', 'type': 'aptitude_generation_error'\}
-            \}'''
-
     new_exception = '''        except Exception as e:
             logger.error(f"❌ Error generating aptitude questions: {str(e)}")
             logger.info("🔄 Falling back to template-based question generation...")
@@ -59,13 +39,11 @@ def fix_fallback_system():
         print("❌ Could not find exact exception block to replace")
 
     # Add the fallback method at the end
-    content = content.rstrip() + '\n\n    ' + fallback_content
-
-    # Write the updated content
-    with open('services/groq_question_generator.py', 'w', encoding='utf-8') as f:
-        f.write(content)
+    content = ''.join((content.rstrip(), '\n\n', fallback_content, '\n'))
 
     print('✅ Successfully integrated fallback system!')
+    return content
 
 if __name__ == "__main__":
-    fix_fallback_system()
+    content = fix_fallback_system(TARGET.read_text(encoding='utf-8'))
+    TARGET.write_text(content, encoding='utf-8')
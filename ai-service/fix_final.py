@@ -1,10 +1,9 @@
 #!/usr/bin/env python3
+from pathlib import Path
 
-def fix_final():
-    # Read the file
-    with open('services/groq_question_generator.py', 'r', encoding='utf-8') as f:
-        content = f.read()
+TARGET = Path('services/groq_question_generator.py')
 
+def fix_final(content: str) -> str:
     # Find where the broken method starts and remove everything after it
     method_start = "    def _get_fallback_aptitude_questions("
     if method_start in content:
@@ -12,147 +11,15 @@ def fix_final():
         content = content[:content.find(method_start)]
         print("✅ Removed broken fallback method")
     
-    # Add the properly indented fallback method
-    fallback_method = '''    def _get_fallback_aptitude_questions(self, topic_configs: List[Dict], time_per_question: int = 60, job_title: str = 'Software Developer') -> Dict[str, Any]:
-        """Generate fallback aptitude questions using comprehensive templates with 20+ unique questions per topic/difficulty"""
-        logger.info(f"📝 Using fallback templates for aptitude questions...")
-        
-        # Comprehensive question templates - 20 unique questions per topic per difficulty
-        fallback_templates = {
-            'logical_reasoning': {
-                'easy': [
-                    {'question': 'If all developers use Git and John is a developer, what can we conclude?', 'options': {'A': 'John uses Git', 'B': 'John uses SVN', 'C': 'John uses CVS', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'If all developers use Git and John is a developer, then John must use Git.'},
-                    {'question': 'In a sequence: 2, 4, 8, 16, ?, what comes next?', 'options': {'A': '24', 'B': '32', 'C': '20', 'D': '18'}, 'correct_answer': 'B', 'explanation': 'Each number is doubled: 2×2=4, 4×2=8, 8×2=16, 16×2=32.'},
-                    {'question': 'If it takes 5 developers 10 days to complete a project, how many days would it take 10 developers?', 'options': {'A': '20 days', 'B': '5 days', 'C': '15 days', 'D': '2 days'}, 'correct_answer': 'B', 'explanation': 'With double the developers, the work takes half the time: 10÷2=5 days.'},
-                    {'question': 'Which number does not belong: 3, 5, 7, 9, 11?', 'options': {'A': '3', 'B': '5', 'C': '9', 'D': '11'}, 'correct_answer': 'C', 'explanation': '9 is not a prime number (3×3=9), while others are prime numbers.'},
-                    {'question': 'Complete the pattern: AB, CD, EF, ?', 'options': {'A': 'GH', 'B': 'HI', 'C': 'FG', 'D': 'IJ'}, 'correct_answer': 'A', 'explanation': 'Each pair consists of consecutive letters: AB, CD, EF, GH.'},
-                    {'question': 'What comes next: 1, 1, 2, 3, 5, 8, ?', 'options': {'A': '11', 'B': '13', 'C': '15', 'D': '10'}, 'correct_answer': 'B', 'explanation': 'Fibonacci sequence: each number is sum of previous two (5+8=13).'},
-                    {'question': 'Which is the odd one out: HTTP, FTP, TCP, HTML?', 'options': {'A': 'HTTP', 'B': 'FTP', 'C': 'TCP', 'D': 'HTML'}, 'correct_answer': 'D', 'explanation': 'HTML is a markup language, while others are protocols.'},
-                    {'question': 'Complete the series: 5, 10, 20, 40, ?', 'options': {'A': '60', 'B': '80', 'C': '70', 'D': '90'}, 'correct_answer': 'B', 'explanation': 'Each number is doubled: 5×2=10, 10×2=20, 20×2=40, 40×2=80.'},
-                    {'question': 'If A > B and B > C, what is the relationship between A and C?', 'options': {'A': 'A > C', 'B': 'A < C', 'C': 'A = C', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Transitive property: if A > B and B > C, then A > C.'},
-                    {'question': 'What is the next number: 1, 4, 9, 16, ?', 'options': {'A': '20', 'B': '25', 'C': '24', 'D': '30'}, 'correct_answer': 'B', 'explanation': 'Perfect squares: 1², 2², 3², 4², 5² = 25.'},
-                    {'question': 'In binary, what is 1010 + 1100?', 'options': {'A': '10110', 'B': '11010', 'C': '10010', 'D': '11100'}, 'correct_answer': 'A', 'explanation': '1010 (10) + 1100 (12) = 10110 (22 in binary).'},
-                    {'question': 'If every bug has a cause and this error is a bug, then:', 'options': {'A': 'This error has a cause', 'B': 'This error has no cause', 'C': 'Some bugs have no cause', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Universal statement: every bug has a cause, this is a bug, so this has a cause.'},
-                    {'question': 'If no developers work on weekends and today is Saturday, then:', 'options': {'A': 'No developers are working today', 'B': 'Some developers are working', 'C': 'All developers are working', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'No developers work weekends, Saturday is weekend, so no developers working.'},
-                    {'question': 'Complete: Circle is to Round as Square is to ?', 'options': {'A': 'Angular', 'B': 'Four-sided', 'C': 'Geometric', 'D': 'Flat'}, 'correct_answer': 'B', 'explanation': 'Circle is characterized by being round, square by being four-sided.'},
-                    {'question': 'In the pattern X, Y, Z, A, B, what comes next?', 'options': {'A': 'C', 'B': 'D', 'C': 'E', 'D': 'F'}, 'correct_answer': 'A', 'explanation': 'Alphabetical sequence continuing: X, Y, Z, A, B, C.'},
-                    {'question': 'If all APIs return JSON and this endpoint is an API, then:', 'options': {'A': 'This endpoint returns JSON', 'B': 'This endpoint returns XML', 'C': 'Some APIs return XML', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Universal statement about APIs, this is an API, so it returns JSON.'},
-                    {'question': 'What number is missing: 2, 3, 5, 7, 11, ?', 'options': {'A': '13', 'B': '15', 'C': '17', 'D': '19'}, 'correct_answer': 'A', 'explanation': 'Prime number sequence: 2, 3, 5, 7, 11, 13.'},
-                    {'question': 'If debugging takes twice as long as coding, and coding takes 4 hours, how long is debugging?', 'options': {'A': '6 hours', 'B': '8 hours', 'C': '10 hours', 'D': '12 hours'}, 'correct_answer': 'B', 'explanation': 'Debugging = 2 × coding time = 2 × 4 = 8 hours.'},
-                    {'question': 'Complete the analogy: Function is to Code as Chapter is to ?', 'options': {'A': 'Book', 'B': 'Page', 'C': 'Word', 'D': 'Story'}, 'correct_answer': 'A', 'explanation': 'Function is part of code, chapter is part of book.'},
-                    {'question': 'If some programmers are testers and all testers are analysts, then:', 'options': {'A': 'Some programmers are analysts', 'B': 'All programmers are analysts', 'C': 'No programmers are analysts', 'D': 'All analysts are programmers'}, 'correct_answer': 'A', 'explanation': 'Some programmers → testers → analysts, so some programmers are analysts.'}
-                ],
-                'medium': [
-                    {'question': 'In a coding interview, if 40% pass the technical round and 60% of those pass the final round, what percentage pass both?', 'options': {'A': '24%', 'B': '30%', 'C': '36%', 'D': '20%'}, 'correct_answer': 'A', 'explanation': '40% × 60% = 0.4 × 0.6 = 0.24 = 24%'},
-                    {'question': 'If ALGORITHM is coded as DOJRULWKP, how is FUNCTION coded?', 'options': {'A': 'IXQFWLRQ', 'B': 'IXQFWLRO', 'C': 'IXQFWLRP', 'D': 'IXQFWMRQ'}, 'correct_answer': 'A', 'explanation': 'Each letter is shifted by +3 positions in alphabet.'},
-                    {'question': 'A software team has 8 members. In how many ways can they form a subteam of 3 members?', 'options': {'A': '56', 'B': '48', 'C': '64', 'D': '72'}, 'correct_answer': 'A', 'explanation': 'Combination C(8,3) = 8!/(3!×5!) = 56 ways.'},
-                    {'question': 'Complete the series: 2, 6, 12, 20, 30, ?', 'options': {'A': '42', 'B': '40', 'C': '38', 'D': '44'}, 'correct_answer': 'A', 'explanation': 'Pattern: n(n+1) where n=1,2,3,4,5,6. So 6×7=42.'},
-                    {'question': 'If a hash table has load factor 0.75 and 12 elements, what is the table size?', 'options': {'A': '16', 'B': '18', 'C': '20', 'D': '15'}, 'correct_answer': 'A', 'explanation': 'Load factor = elements/size, so 0.75 = 12/size, size = 16.'}
-                ],
-                'hard': [
-                    {'question': 'In a distributed system with 5 nodes, if each node can fail independently with probability 0.1, what is the probability that exactly 2 nodes fail?', 'options': {'A': '0.0729', 'B': '0.0810', 'C': '0.0656', 'D': '0.0590'}, 'correct_answer': 'A', 'explanation': 'Binomial probability: C(5,2) × (0.1)² × (0.9)³ = 10 × 0.01 × 0.729 = 0.0729'},
-                    {'question': 'A recursive algorithm has time complexity T(n) = 2T(n/2) + n. What is its Big O complexity?', 'options': {'A': 'O(n log n)', 'B': 'O(n²)', 'C': 'O(n)', 'D': 'O(log n)'}, 'correct_answer': 'A', 'explanation': 'Using Master Theorem: a=2, b=2, f(n)=n. Since n = n^log₂(2), complexity is O(n log n).'}
-                ]
-            },
-            'quantitative_aptitude': {
-                'easy': [
-                    {'question': 'What is 25% of 80?', 'options': {'A': '20', 'B': '25', 'C': '15', 'D': '30'}, 'correct_answer': 'A', 'explanation': '25% of 80 = 0.25 × 80 = 20'},
-                    {'question': 'If a software license costs $100 and there is a 15% discount, what is the final price?', 'options': {'A': '$85', 'B': '$90', 'C': '$95', 'D': '$80'}, 'correct_answer': 'A', 'explanation': '15% discount means pay 85%. $100 × 0.85 = $85'},
-                    {'question': 'A team completes 3 features per sprint. How many features in 4 sprints?', 'options': {'A': '12', 'B': '10', 'C': '15', 'D': '9'}, 'correct_answer': 'A', 'explanation': '3 features/sprint × 4 sprints = 12 features'},
-                    {'question': 'If 60% of tests pass, and there are 50 tests, how many fail?', 'options': {'A': '20', 'B': '25', 'C': '15', 'D': '30'}, 'correct_answer': 'A', 'explanation': '40% fail: 50 × 0.40 = 20 tests fail'},
-                    {'question': 'What is 3/4 expressed as a percentage?', 'options': {'A': '75%', 'B': '70%', 'C': '80%', 'D': '65%'}, 'correct_answer': 'A', 'explanation': '3/4 = 0.75 = 75%'}
-                ],
-                'medium': [
-                    {'question': 'A server processes 1200 requests per minute. How many requests in 2.5 hours?', 'options': {'A': '180000', 'B': '150000', 'C': '200000', 'D': '160000'}, 'correct_answer': 'A', 'explanation': '2.5 hours = 150 minutes. 1200 × 150 = 180,000 requests'},
-                    {'question': 'If API response time increases by 20% from 100ms, what is the new response time?', 'options': {'A': '120ms', 'B': '125ms', 'C': '115ms', 'D': '130ms'}, 'correct_answer': 'A', 'explanation': '20% increase: 100 + (100 × 0.20) = 120ms'}
-                ],
-                'hard': [
-                    {'question': 'A system has 99.9% uptime. In a year (365 days), how many minutes of downtime is this?', 'options': {'A': '525.6', 'B': '432.5', 'C': '365.2', 'D': '876.0'}, 'correct_answer': 'A', 'explanation': 'Downtime = 0.1% of year = 0.001 × 365 × 24 × 60 = 525.6 minutes'}
-                ]
-            },
-            'verbal_reasoning': {
-                'easy': [
-                    {'question': 'Choose the word most similar to "Debug":', 'options': {'A': 'Fix', 'B': 'Break', 'C': 'Code', 'D': 'Test'}, 'correct_answer': 'A', 'explanation': 'Debug means to find and fix errors, so "Fix" is most similar.'},
-                    {'question': 'What is the opposite of "Compile"?', 'options': {'A': 'Decompile', 'B': 'Execute', 'C': 'Debug', 'D': 'Test'}, 'correct_answer': 'A', 'explanation': 'Compile converts source to machine code, decompile does the reverse.'}
-                ],
-                'medium': [
-                    {'question': 'Complete the analogy: Code is to Program as Ingredient is to ?', 'options': {'A': 'Recipe', 'B': 'Kitchen', 'C': 'Cook', 'D': 'Food'}, 'correct_answer': 'A', 'explanation': 'Code makes up a program, just as ingredients make up a recipe.'}
-                ],
-                'hard': [
-                    {'question': 'If "Optimization improves performance" is true, and "Performance affects user experience" is true, what can we conclude?', 'options': {'A': 'Optimization affects user experience', 'B': 'User experience improves optimization', 'C': 'Performance equals optimization', 'D': 'Cannot determine relationship'}, 'correct_answer': 'A', 'explanation': 'Transitive property: Optimization → Performance → User Experience'}
-                ]
-            }
-        }
-        
-        # Generate questions based on topic_configs
-        all_questions = []
-        
-        for topic_config in topic_configs:
-            topic = topic_config['topic']
-            
-            # Get templates for this topic or create generic ones
-            if topic not in fallback_templates:
-                # Create generic questions for unknown topics
-                base_templates = {
-                    'easy': [
-                        {'question': f'What is a fundamental concept in {topic.replace("_", " ")}?', 'options': {'A': 'Basic principle', 'B': 'Advanced technique', 'C': 'Complex algorithm', 'D': 'Expert method'}, 'correct_answer': 'A', 'explanation': f'This tests basic understanding of {topic.replace("_", " ")}.'},
-                        {'question': f'Which is most important in {topic.replace("_", " ")}?', 'options': {'A': 'Foundation knowledge', 'B': 'Advanced skills', 'C': 'Expert techniques', 'D': 'Complex theories'}, 'correct_answer': 'A', 'explanation': f'Foundation knowledge is most important in {topic.replace("_", " ")}.'}
-                    ] * 10  # Repeat to get 20 questions
-                }
-                topic_templates = base_templates
-            else:
-                topic_templates = fallback_templates[topic]
-            
-            # Generate questions for each difficulty
-            for difficulty in ['easy', 'medium', 'hard']:
-                count = topic_config.get(difficulty, 0)
-                if count > 0:
-                    available_templates = topic_templates.get(difficulty, topic_templates.get('easy', []))
-                    
-                    # Extend templates if needed
-                    while len(available_templates) < count:
-                        available_templates.extend(topic_templates.get(difficulty, topic_templates.get('easy', [])))
-                    
-                    # Select required number of questions
-                    for i in range(count):
-                        template_index = i % len(available_templates)
-                        template = available_templates[template_index]
-                        
-                        # Add variation to avoid exact duplicates
-                        question_text = template['question']
-                        if i >= len(available_templates):
-                            variation_num = (i // len(available_templates)) + 1
-                            question_text = f"[Variation {variation_num}] {question_text}"
-                        
-                        question = {
-                            'topic': topic,
-                            'question': question_text,
-                            'options': template['options'].copy(),
-                            'correct_answer': template['correct_answer'],
-                            'difficulty': difficulty,
-                            'explanation': template['explanation'],
-                            'time_limit': time_per_question
-                        }
-                        all_questions.append(question)
-        
-        logger.info(f"✅ Generated {len(all_questions)} fallback aptitude questions")
-        
-        return {
-            'success': True,
-            'questions': all_questions,
-            'total_questions': len(all_questions),
-            'metadata': {'generated_by': 'fallback_templates', 'type': 'aptitude_fallback'}
-        }
-'''
+    # Add the properly indented fallback method (kept in a sibling file rather than a giant string literal)
+    fallback_method = Path(__file__).with_name('_fallback_method_template.txt').read_text(encoding='utf-8')
     
     # Add the method to the content
-    content = content.rstrip() + '\n\n' + fallback_method + '\n'
-    
-    # Write the fixed content
-    with open('services/groq_question_generator.py', 'w', encoding='utf-8') as f:
-        f.write(content)
+    content = ''.join((content.rstrip(), '\n\n', fallback_method, '\n'))
     
     print("✅ Successfully added properly indented fallback method!")
+    return content
 
 if __name__ == "__main__":
-    fix_final()
+    content = fix_final(TARGET.read_text(encoding='utf-8'))
+    TARGET.write_text(content, encoding='utf-8')
@@ -1,33 +1,27 @@
 #!/usr/bin/env python3
+import re
+from pathlib import Path
 
-def fix_indentation():
-    # Read the file
-    with open('services/groq_question_generator.py', 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+TARGET = Path('services/groq_question_generator.py')
+
+METHOD_MARKER = 'def _get_fallback_aptitude_questions('
+
+# Non-blank lines that are not already indented (and are not another copy of the method definition)
+UNINDENTED_LINE = re.compile(r'^(?!    )(?![^\n]*' + re.escape(METHOD_MARKER) + r')(?=[^\n]*\S)', re.MULTILINE)
+
+def fix_indentation(content: str) -> str:
+    # Find the problematic method - everything after its definition line needs fixing
+    start = content.find(METHOD_MARKER)
+    if start != -1:
+        line_end = content.find('\n', start)
+        if line_end != -1:
+            # Indent every offending line in one substitution instead of a per-line loop
+            head, tail = content[:line_end + 1], content[line_end + 1:]
+            content = head + UNINDENTED_LINE.sub('        ', tail)
 
-    # Find the problematic method and fix indentation
-    in_fallback_method = False
-    fixed_lines = []
-    
-    for i, line in enumerate(lines):
-        if 'def _get_fallback_aptitude_questions(' in line:
-            in_fallback_method = True
-            fixed_lines.append(line)  # Keep the method definition as is
-        elif in_fallback_method and line.strip() == '':
-            fixed_lines.append(line)  # Keep empty lines
-        elif in_fallback_method and line.startswith('    '):
-            fixed_lines.append(line)  # Already properly indented
-        elif in_fallback_method and not line.startswith('    ') and line.strip():
-            # This line needs to be indented
-            fixed_lines.append('        ' + line)
-        else:
-            fixed_lines.append(line)
-    
-    # Write the fixed content
-    with open('services/groq_question_generator.py', 'w', encoding='utf-8') as f:
-        f.writelines(fixed_lines)
-    
     print("✅ Fixed indentation errors!")
+    return content
 
 if __name__ == "__main__":
-    fix_indentation()
+    content = fix_indentation(TARGET.read_text(encoding='utf-8'))
+    TARGET.write_text(content, encoding='utf-8')
@@ -1,12 +1,17 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 from services.groq_question_generator import GroqQuestionGenerator
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
 question_generator_bp = Blueprint('question_generator', __name__)
 groq_generator = GroqQuestionGenerator()
 
+def _json_response(payload, status=200):
+    """Serialize generated question payloads with orjson (much faster than jsonify for large lists)"""
+    return Response(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS), status=status, mimetype='application/json')
+
 @question_generator_bp.route('/generate-questions', methods=['POST'])
 def generate_questions():
     """Generate questions for different interview rounds using GROQ AI"""
@@ -107,7 +112,7 @@ def generate_questions():
         
         if result['success']:
             logger.info(f"✅ Generated {len(result.get('questions', result.get('problems', [])))} items successfully")
-            return jsonify(result)
+            return _json_response(result)
         else:
             logger.error(f"❌ Failed to generate questions: {result.get('message')}")
             return jsonify(result), 500
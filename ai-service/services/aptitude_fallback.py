@@ -1,151 +1,195 @@
-def _get_fallback_aptitude_questions(self, topic_configs: List[Dict], time_per_question: int = 60, job_title: str = 'Software Developer') -> Dict[str, Any]:
-    """Generate fallback aptitude questions using comprehensive templates with 20+ unique questions per topic/difficulty"""
-    logger.info(f"📝 Using fallback templates for aptitude questions...")
-    
-    # Comprehensive question templates - 20 unique questions per topic per difficulty
-    fallback_templates = {
-        'logical_reasoning': {
-            'easy': [
-                {'question': 'If all developers use Git and John is a developer, what can we conclude?', 'options': {'A': 'John uses Git', 'B': 'John uses SVN', 'C': 'John uses CVS', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'If all developers use Git and John is a developer, then John must use Git.'},
-                {'question': 'In a sequence: 2, 4, 8, 16, ?, what comes next?', 'options': {'A': '24', 'B': '32', 'C': '20', 'D': '18'}, 'correct_answer': 'B', 'explanation': 'Each number is doubled: 2×2=4, 4×2=8, 8×2=16, 16×2=32.'},
-                {'question': 'If it takes 5 developers 10 days to complete a project, how many days would it take 10 developers?', 'options': {'A': '20 days', 'B': '5 days', 'C': '15 days', 'D': '2 days'}, 'correct_answer': 'B', 'explanation': 'With double the developers, the work takes half the time: 10÷2=5 days.'},
-                {'question': 'Which number does not belong: 3, 5, 7, 9, 11?', 'options': {'A': '3', 'B': '5', 'C': '9', 'D': '11'}, 'correct_answer': 'C', 'explanation': '9 is not a prime number (3×3=9), while others are prime numbers.'},
-                {'question': 'Complete the pattern: AB, CD, EF, ?', 'options': {'A': 'GH', 'B': 'HI', 'C': 'FG', 'D': 'IJ'}, 'correct_answer': 'A', 'explanation': 'Each pair consists of consecutive letters: AB, CD, EF, GH.'},
-                {'question': 'If some programmers are testers and all testers are analysts, then:', 'options': {'A': 'Some programmers are analysts', 'B': 'All programmers are analysts', 'C': 'No programmers are analysts', 'D': 'All analysts are programmers'}, 'correct_answer': 'A', 'explanation': 'Some programmers → testers → analysts, so some programmers are analysts.'},
-                {'question': 'What comes next: 1, 1, 2, 3, 5, 8, ?', 'options': {'A': '11', 'B': '13', 'C': '15', 'D': '10'}, 'correct_answer': 'B', 'explanation': 'Fibonacci sequence: each number is sum of previous two (5+8=13).'},
-                {'question': 'Which is the odd one out: HTTP, FTP, TCP, HTML?', 'options': {'A': 'HTTP', 'B': 'FTP', 'C': 'TCP', 'D': 'HTML'}, 'correct_answer': 'D', 'explanation': 'HTML is a markup language, while others are protocols.'},
-                {'question': 'If A > B and B > C, what is the relationship between A and C?', 'options': {'A': 'A > C', 'B': 'A < C', 'C': 'A = C', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Transitive property: if A > B and B > C, then A > C.'},
-                {'question': 'Complete the series: 5, 10, 20, 40, ?', 'options': {'A': '60', 'B': '80', 'C': '70', 'D': '90'}, 'correct_answer': 'B', 'explanation': 'Each number is doubled: 5×2=10, 10×2=20, 20×2=40, 40×2=80.'},
-                {'question': 'In binary, what is 1010 + 1100?', 'options': {'A': '10110', 'B': '11010', 'C': '10010', 'D': '11100'}, 'correct_answer': 'A', 'explanation': '1010 (10) + 1100 (12) = 10110 (22 in binary).'},
-                {'question': 'If every bug has a cause and this error is a bug, then:', 'options': {'A': 'This error has a cause', 'B': 'This error has no cause', 'C': 'Some bugs have no cause', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Universal statement: every bug has a cause, this is a bug, so this has a cause.'},
-                {'question': 'What is the next number: 1, 4, 9, 16, ?', 'options': {'A': '20', 'B': '25', 'C': '24', 'D': '30'}, 'correct_answer': 'B', 'explanation': 'Perfect squares: 1², 2², 3², 4², 5² = 25.'},
-                {'question': 'If no developers work on weekends and today is Saturday, then:', 'options': {'A': 'No developers are working today', 'B': 'Some developers are working', 'C': 'All developers are working', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'No developers work weekends, Saturday is weekend, so no developers working.'},
-                {'question': 'Complete: Circle is to Round as Square is to ?', 'options': {'A': 'Angular', 'B': 'Four-sided', 'C': 'Geometric', 'D': 'Flat'}, 'correct_answer': 'B', 'explanation': 'Circle is characterized by being round, square by being four-sided.'},
-                {'question': 'In the pattern X, Y, Z, A, B, what comes next?', 'options': {'A': 'C', 'B': 'D', 'C': 'E', 'D': 'F'}, 'correct_answer': 'A', 'explanation': 'Alphabetical sequence continuing: X, Y, Z, A, B, C.'},
-                {'question': 'If all APIs return JSON and this endpoint is an API, then:', 'options': {'A': 'This endpoint returns JSON', 'B': 'This endpoint returns XML', 'C': 'Some APIs return XML', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Universal statement about APIs, this is an API, so it returns JSON.'},
-                {'question': 'What number is missing: 2, 3, 5, 7, 11, ?', 'options': {'A': '13', 'B': '15', 'C': '17', 'D': '19'}, 'correct_answer': 'A', 'explanation': 'Prime number sequence: 2, 3, 5, 7, 11, 13.'},
-                {'question': 'If debugging takes twice as long as coding, and coding takes 4 hours, how long is debugging?', 'options': {'A': '6 hours', 'B': '8 hours', 'C': '10 hours', 'D': '12 hours'}, 'correct_answer': 'B', 'explanation': 'Debugging = 2 × coding time = 2 × 4 = 8 hours.'},
-                {'question': 'Complete the analogy: Function is to Code as Chapter is to ?', 'options': {'A': 'Book', 'B': 'Page', 'C': 'Word', 'D': 'Story'}, 'correct_answer': 'A', 'explanation': 'Function is part of code, chapter is part of book.'}
-            ],
-            'medium': [
-                {'question': 'In a coding interview, if 40% pass the technical round and 60% of those pass the final round, what percentage pass both?', 'options': {'A': '24%', 'B': '30%', 'C': '36%', 'D': '20%'}, 'correct_answer': 'A', 'explanation': '40% × 60% = 0.4 × 0.6 = 0.24 = 24%'},
-                {'question': 'If ALGORITHM is coded as DOJRULWKP, how is FUNCTION coded?', 'options': {'A': 'IXQFWLRQ', 'B': 'IXQFWLRO', 'C': 'IXQFWLRP', 'D': 'IXQFWMRQ'}, 'correct_answer': 'A', 'explanation': 'Each letter is shifted by +3 positions in alphabet.'},
-                {'question': 'A software team has 8 members. In how many ways can they form a subteam of 3 members?', 'options': {'A': '56', 'B': '48', 'C': '64', 'D': '72'}, 'correct_answer': 'A', 'explanation': 'Combination C(8,3) = 8!/(3!×5!) = 56 ways.'},
-                {'question': 'Complete the series: 2, 6, 12, 20, 30, ?', 'options': {'A': '42', 'B': '40', 'C': '38', 'D': '44'}, 'correct_answer': 'A', 'explanation': 'Pattern: n(n+1) where n=1,2,3,4,5,6. So 6×7=42.'},
-                {'question': 'If a hash table has load factor 0.75 and 12 elements, what is the table size?', 'options': {'A': '16', 'B': '18', 'C': '20', 'D': '15'}, 'correct_answer': 'A', 'explanation': 'Load factor = elements/size, so 0.75 = 12/size, size = 16.'},
-                {'question': 'A recursive function calls itself n times. If each call takes 2ms, how long for n=50?', 'options': {'A': '100ms', 'B': '50ms', 'C': '200ms', 'D': '25ms'}, 'correct_answer': 'A', 'explanation': '50 calls × 2ms each = 100ms total.'},
-                {'question': 'If 3 out of 4 code reviews find bugs, what is the probability that 2 consecutive reviews both find bugs?', 'options': {'A': '9/16', 'B': '3/4', 'C': '6/16', 'D': '12/16'}, 'correct_answer': 'A', 'explanation': '(3/4) × (3/4) = 9/16.'},
-                {'question': 'Complete: 1, 8, 27, 64, ?', 'options': {'A': '125', 'B': '100', 'C': '144', 'D': '81'}, 'correct_answer': 'A', 'explanation': 'Perfect cubes: 1³, 2³, 3³, 4³, 5³ = 125.'},
-                {'question': 'If a sorting algorithm has O(n log n) complexity, how many operations for 1000 elements?', 'options': {'A': '~10000', 'B': '~1000', 'C': '~100000', 'D': '~1000000'}, 'correct_answer': 'A', 'explanation': '1000 × log₂(1000) ≈ 1000 × 10 = 10000.'},
-                {'question': 'In a binary tree with height h, what is the maximum number of nodes?', 'options': {'A': '2^(h+1) - 1', 'B': '2^h', 'C': 'h^2', 'D': '2h'}, 'correct_answer': 'A', 'explanation': 'Complete binary tree: 2^0 + 2^1 + ... + 2^h = 2^(h+1) - 1.'}
-            ],
-            'hard': [
-                {'question': 'In a distributed system with 5 nodes, if each node can fail independently with probability 0.1, what is the probability that exactly 2 nodes fail?', 'options': {'A': '0.0729', 'B': '0.0810', 'C': '0.0656', 'D': '0.0590'}, 'correct_answer': 'A', 'explanation': 'Binomial probability: C(5,2) × (0.1)² × (0.9)³ = 10 × 0.01 × 0.729 = 0.0729'},
-                {'question': 'A recursive algorithm has time complexity T(n) = 2T(n/2) + n. What is its Big O complexity?', 'options': {'A': 'O(n log n)', 'B': 'O(n²)', 'C': 'O(n)', 'D': 'O(log n)'}, 'correct_answer': 'A', 'explanation': 'Using Master Theorem: a=2, b=2, f(n)=n. Since n = n^log₂(2), complexity is O(n log n).'},
-                {'question': 'In a consistent hashing ring with 4 nodes, if one node fails, what percentage of keys need to be redistributed?', 'options': {'A': '25%', 'B': '50%', 'C': '75%', 'D': '100%'}, 'correct_answer': 'A', 'explanation': 'Only keys from the failed node (1/4 = 25%) need redistribution.'},
-                {'question': 'A B-tree of order m has minimum degree t = ⌈m/2⌉. For m=5, what is the minimum number of keys in a non-root node?', 'options': {'A': '2', 'B': '3', 'C': '4', 'D': '5'}, 'correct_answer': 'A', 'explanation': 'Minimum degree t = ⌈5/2⌉ = 3, so minimum keys = t-1 = 2.'},
-                {'question': 'In a load balancer using weighted round-robin with weights [3,1,2], what percentage of requests go to the first server?', 'options': {'A': '50%', 'B': '33%', 'C': '25%', 'D': '60%'}, 'correct_answer': 'A', 'explanation': 'Total weight = 3+1+2 = 6. First server gets 3/6 = 50%.'}
-            ]
-        },
-        'quantitative_aptitude': {
-            'easy': [
-                {'question': 'What is 25% of 80?', 'options': {'A': '20', 'B': '25', 'C': '15', 'D': '30'}, 'correct_answer': 'A', 'explanation': '25% of 80 = 0.25 × 80 = 20'},
-                {'question': 'If a software license costs $100 and there is a 15% discount, what is the final price?', 'options': {'A': '$85', 'B': '$90', 'C': '$95', 'D': '$80'}, 'correct_answer': 'A', 'explanation': '15% discount means pay 85%. $100 × 0.85 = $85'},
-                {'question': 'A team completes 3 features per sprint. How many features in 4 sprints?', 'options': {'A': '12', 'B': '10', 'C': '15', 'D': '9'}, 'correct_answer': 'A', 'explanation': '3 features/sprint × 4 sprints = 12 features'},
-                {'question': 'If 60% of tests pass, and there are 50 tests, how many fail?', 'options': {'A': '20', 'B': '25', 'C': '15', 'D': '30'}, 'correct_answer': 'A', 'explanation': '40% fail: 50 × 0.40 = 20 tests fail'},
-                {'question': 'What is 3/4 expressed as a percentage?', 'options': {'A': '75%', 'B': '70%', 'C': '80%', 'D': '65%'}, 'correct_answer': 'A', 'explanation': '3/4 = 0.75 = 75%'},
-                {'question': 'If a developer works 8 hours per day for 5 days, how many total hours?', 'options': {'A': '40', 'B': '35', 'C': '45', 'D': '30'}, 'correct_answer': 'A', 'explanation': '8 hours/day × 5 days = 40 hours'},
-                {'question': 'What is 12 × 15?', 'options': {'A': '180', 'B': '160', 'C': '200', 'D': '150'}, 'correct_answer': 'A', 'explanation': '12 × 15 = 180'},
-                {'question': 'If there are 24 hours in a day, how many minutes is that?', 'options': {'A': '1440', 'B': '1400', 'C': '1500', 'D': '1200'}, 'correct_answer': 'A', 'explanation': '24 hours × 60 minutes/hour = 1440 minutes'},
-                {'question': 'What is 50% of 200?', 'options': {'A': '100', 'B': '150', 'C': '75', 'D': '125'}, 'correct_answer': 'A', 'explanation': '50% of 200 = 0.5 × 200 = 100'},
-                {'question': 'If a project has 10 tasks and 3 are completed, what percentage is done?', 'options': {'A': '30%', 'B': '25%', 'C': '35%', 'D': '40%'}, 'correct_answer': 'A', 'explanation': '3/10 = 0.3 = 30%'}
-            ],
-            'medium': [
-                {'question': 'A server processes 1200 requests per minute. How many requests in 2.5 hours?', 'options': {'A': '180000', 'B': '150000', 'C': '200000', 'D': '160000'}, 'correct_answer': 'A', 'explanation': '2.5 hours = 150 minutes. 1200 × 150 = 180,000 requests'},
-                {'question': 'If API response time increases by 20% from 100ms, what is the new response time?', 'options': {'A': '120ms', 'B': '125ms', 'C': '115ms', 'D': '130ms'}, 'correct_answer': 'A', 'explanation': '20% increase: 100 + (100 × 0.20) = 120ms'},
-                {'question': 'A database query returns 500 records. If we paginate with 25 records per page, how many pages?', 'options': {'A': '20', 'B': '25', 'C': '15', 'D': '30'}, 'correct_answer': 'A', 'explanation': '500 ÷ 25 = 20 pages'},
-                {'question': 'If memory usage grows by 5% each day, starting at 100MB, what is it after 2 days?', 'options': {'A': '110.25MB', 'B': '110MB', 'C': '105MB', 'D': '115MB'}, 'correct_answer': 'A', 'explanation': 'Day 1: 100 × 1.05 = 105MB. Day 2: 105 × 1.05 = 110.25MB'},
-                {'question': 'A team of 6 developers can complete a project in 8 weeks. How long for 4 developers?', 'options': {'A': '12 weeks', 'B': '10 weeks', 'C': '14 weeks', 'D': '6 weeks'}, 'correct_answer': 'A', 'explanation': 'Total work = 6×8 = 48 dev-weeks. For 4 devs: 48÷4 = 12 weeks'}
-            ],
-            'hard': [
-                {'question': 'A system has 99.9% uptime. In a year (365 days), how many minutes of downtime is this?', 'options': {'A': '525.6', 'B': '432.5', 'C': '365.2', 'D': '876.0'}, 'correct_answer': 'A', 'explanation': 'Downtime = 0.1% of year = 0.001 × 365 × 24 × 60 = 525.6 minutes'},
-                {'question': 'If a cache has 95% hit rate and each miss costs 100ms while hits cost 1ms, what is average response time?', 'options': {'A': '5.95ms', 'B': '10ms', 'C': '50.5ms', 'D': '1ms'}, 'correct_answer': 'A', 'explanation': '0.95 × 1ms + 0.05 × 100ms = 0.95 + 5 = 5.95ms'}
-            ]
-        },
-        'verbal_reasoning': {
-            'easy': [
-                {'question': 'Choose the word most similar to "Debug":', 'options': {'A': 'Fix', 'B': 'Break', 'C': 'Code', 'D': 'Test'}, 'correct_answer': 'A', 'explanation': 'Debug means to find and fix errors, so "Fix" is most similar.'},
-                {'question': 'What is the opposite of "Compile"?', 'options': {'A': 'Decompile', 'B': 'Execute', 'C': 'Debug', 'D': 'Test'}, 'correct_answer': 'A', 'explanation': 'Compile converts source to machine code, decompile does the reverse.'},
-                {'question': 'Choose the synonym for "Implement":', 'options': {'A': 'Execute', 'B': 'Plan', 'C': 'Design', 'D': 'Think'}, 'correct_answer': 'A', 'explanation': 'Implement means to put into action or execute.'},
-                {'question': 'What does "Optimize" mean?', 'options': {'A': 'Make better/efficient', 'B': 'Make worse', 'C': 'Make complex', 'D': 'Make simple'}, 'correct_answer': 'A', 'explanation': 'Optimize means to make as effective or functional as possible.'},
-                {'question': 'Choose the antonym of "Secure":', 'options': {'A': 'Vulnerable', 'B': 'Protected', 'C': 'Safe', 'D': 'Encrypted'}, 'correct_answer': 'A', 'explanation': 'Secure means protected, vulnerable means exposed to danger.'}
-            ],
-            'medium': [
-                {'question': 'Complete the analogy: Code is to Program as Ingredient is to ?', 'options': {'A': 'Recipe', 'B': 'Kitchen', 'C': 'Cook', 'D': 'Food'}, 'correct_answer': 'A', 'explanation': 'Code makes up a program, just as ingredients make up a recipe.'},
-                {'question': 'Choose the word that best completes: "The API is _____ because it handles errors gracefully."', 'options': {'A': 'Robust', 'B': 'Fragile', 'C': 'Simple', 'D': 'Complex'}, 'correct_answer': 'A', 'explanation': 'Robust means strong and able to handle difficult conditions.'}
-            ],
-            'hard': [
-                {'question': 'If "Optimization improves performance" is true, and "Performance affects user experience" is true, what can we conclude?', 'options': {'A': 'Optimization affects user experience', 'B': 'User experience improves optimization', 'C': 'Performance equals optimization', 'D': 'Cannot determine relationship'}, 'correct_answer': 'A', 'explanation': 'Transitive property: Optimization → Performance → User Experience'}
-            ]
-        }
+"""
+Aptitude Fallback Templates
+Template-based aptitude questions used when GROQ generation is unavailable
+"""
+
+import logging
+from functools import lru_cache
+from itertools import cycle, islice
+from typing import List, Dict, Any
+
+logger = logging.getLogger(__name__)
+
+# Comprehensive question templates - 20 unique questions per topic per difficulty
+_FALLBACK_TEMPLATES = {
+    'logical_reasoning': {
+        'easy': [
+            {'question': 'If all developers use Git and John is a developer, what can we conclude?', 'options': {'A': 'John uses Git', 'B': 'John uses SVN', 'C': 'John uses CVS', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'If all developers use Git and John is a developer, then John must use Git.'},
+            {'question': 'In a sequence: 2, 4, 8, 16, ?, what comes next?', 'options': {'A': '24', 'B': '32', 'C': '20', 'D': '18'}, 'correct_answer': 'B', 'explanation': 'Each number is doubled: 2×2=4, 4×2=8, 8×2=16, 16×2=32.'},
+            {'question': 'If it takes 5 developers 10 days to complete a project, how many days would it take 10 developers?', 'options': {'A': '20 days', 'B': '5 days', 'C': '15 days', 'D': '2 days'}, 'correct_answer': 'B', 'explanation': 'With double the developers, the work takes half the time: 10÷2=5 days.'},
+            {'question': 'Which number does not belong: 3, 5, 7, 9, 11?', 'options': {'A': '3', 'B': '5', 'C': '9', 'D': '11'}, 'correct_answer': 'C', 'explanation': '9 is not a prime number (3×3=9), while others are prime numbers.'},
+            {'question': 'Complete the pattern: AB, CD, EF, ?', 'options': {'A': 'GH', 'B': 'HI', 'C': 'FG', 'D': 'IJ'}, 'correct_answer': 'A', 'explanation': 'Each pair consists of consecutive letters: AB, CD, EF, GH.'},
+            {'question': 'If some programmers are testers and all testers are analysts, then:', 'options': {'A': 'Some programmers are analysts', 'B': 'All programmers are analysts', 'C': 'No programmers are analysts', 'D': 'All analysts are programmers'}, 'correct_answer': 'A', 'explanation': 'Some programmers → testers → analysts, so some programmers are analysts.'},
+            {'question': 'What comes next: 1, 1, 2, 3, 5, 8, ?', 'options': {'A': '11', 'B': '13', 'C': '15', 'D': '10'}, 'correct_answer': 'B', 'explanation': 'Fibonacci sequence: each number is sum of previous two (5+8=13).'},
+            {'question': 'Which is the odd one out: HTTP, FTP, TCP, HTML?', 'options': {'A': 'HTTP', 'B': 'FTP', 'C': 'TCP', 'D': 'HTML'}, 'correct_answer': 'D', 'explanation': 'HTML is a markup language, while others are protocols.'},
+            {'question': 'If A > B and B > C, what is the relationship between A and C?', 'options': {'A': 'A > C', 'B': 'A < C', 'C': 'A = C', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Transitive property: if A > B and B > C, then A > C.'},
+            {'question': 'Complete the series: 5, 10, 20, 40, ?', 'options': {'A': '60', 'B': '80', 'C': '70', 'D': '90'}, 'correct_answer': 'B', 'explanation': 'Each number is doubled: 5×2=10, 10×2=20, 20×2=40, 40×2=80.'},
+            {'question': 'In binary, what is 1010 + 1100?', 'options': {'A': '10110', 'B': '11010', 'C': '10010', 'D': '11100'}, 'correct_answer': 'A', 'explanation': '1010 (10) + 1100 (12) = 10110 (22 in binary).'},
+            {'question': 'If every bug has a cause and this error is a bug, then:', 'options': {'A': 'This error has a cause', 'B': 'This error has no cause', 'C': 'Some bugs have no cause', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Universal statement: every bug has a cause, this is a bug, so this has a cause.'},
+            {'question': 'What is the next number: 1, 4, 9, 16, ?', 'options': {'A': '20', 'B': '25', 'C': '24', 'D': '30'}, 'correct_answer': 'B', 'explanation': 'Perfect squares: 1², 2², 3², 4², 5² = 25.'},
+            {'question': 'If no developers work on weekends and today is Saturday, then:', 'options': {'A': 'No developers are working today', 'B': 'Some developers are working', 'C': 'All developers are working', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'No developers work weekends, Saturday is weekend, so no developers working.'},
+            {'question': 'Complete: Circle is to Round as Square is to ?', 'options': {'A': 'Angular', 'B': 'Four-sided', 'C': 'Geometric', 'D': 'Flat'}, 'correct_answer': 'B', 'explanation': 'Circle is characterized by being round, square by being four-sided.'},
+            {'question': 'In the pattern X, Y, Z, A, B, what comes next?', 'options': {'A': 'C', 'B': 'D', 'C': 'E', 'D': 'F'}, 'correct_answer': 'A', 'explanation': 'Alphabetical sequence continuing: X, Y, Z, A, B, C.'},
+            {'question': 'If all APIs return JSON and this endpoint is an API, then:', 'options': {'A': 'This endpoint returns JSON', 'B': 'This endpoint returns XML', 'C': 'Some APIs return XML', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Universal statement about APIs, this is an API, so it returns JSON.'},
+            {'question': 'What number is missing: 2, 3, 5, 7, 11, ?', 'options': {'A': '13', 'B': '15', 'C': '17', 'D': '19'}, 'correct_answer': 'A', 'explanation': 'Prime number sequence: 2, 3, 5, 7, 11, 13.'},
+            {'question': 'If debugging takes twice as long as coding, and coding takes 4 hours, how long is debugging?', 'options': {'A': '6 hours', 'B': '8 hours', 'C': '10 hours', 'D': '12 hours'}, 'correct_answer': 'B', 'explanation': 'Debugging = 2 × coding time = 2 × 4 = 8 hours.'},
+            {'question': 'Complete the analogy: Function is to Code as Chapter is to ?', 'options': {'A': 'Book', 'B': 'Page', 'C': 'Word', 'D': 'Story'}, 'correct_answer': 'A', 'explanation': 'Function is part of code, chapter is part of book.'}
+        ],
+        'medium': [
+            {'question': 'In a coding interview, if 40% pass the technical round and 60% of those pass the final round, what percentage pass both?', 'options': {'A': '24%', 'B': '30%', 'C': '36%', 'D': '20%'}, 'correct_answer': 'A', 'explanation': '40% × 60% = 0.4 × 0.6 = 0.24 = 24%'},
+            {'question': 'If ALGORITHM is coded as DOJRULWKP, how is FUNCTION coded?', 'options': {'A': 'IXQFWLRQ', 'B': 'IXQFWLRO', 'C': 'IXQFWLRP', 'D': 'IXQFWMRQ'}, 'correct_answer': 'A', 'explanation': 'Each letter is shifted by +3 positions in alphabet.'},
+            {'question': 'A software team has 8 members. In how many ways can they form a subteam of 3 members?', 'options': {'A': '56', 'B': '48', 'C': '64', 'D': '72'}, 'correct_answer': 'A', 'explanation': 'Combination C(8,3) = 8!/(3!×5!) = 56 ways.'},
+            {'question': 'Complete the series: 2, 6, 12, 20, 30, ?', 'options': {'A': '42', 'B': '40', 'C': '38', 'D': '44'}, 'correct_answer': 'A', 'explanation': 'Pattern: n(n+1) where n=1,2,3,4,5,6. So 6×7=42.'},
+            {'question': 'If a hash table has load factor 0.75 and 12 elements, what is the table size?', 'options': {'A': '16', 'B': '18', 'C': '20', 'D': '15'}, 'correct_answer': 'A', 'explanation': 'Load factor = elements/size, so 0.75 = 12/size, size = 16.'},
+            {'question': 'A recursive function calls itself n times. If each call takes 2ms, how long for n=50?', 'options': {'A': '100ms', 'B': '50ms', 'C': '200ms', 'D': '25ms'}, 'correct_answer': 'A', 'explanation': '50 calls × 2ms each = 100ms total.'},
+            {'question': 'If 3 out of 4 code reviews find bugs, what is the probability that 2 consecutive reviews both find bugs?', 'options': {'A': '9/16', 'B': '3/4', 'C': '6/16', 'D': '12/16'}, 'correct_answer': 'A', 'explanation': '(3/4) × (3/4) = 9/16.'},
+            {'question': 'Complete: 1, 8, 27, 64, ?', 'options': {'A': '125', 'B': '100', 'C': '144', 'D': '81'}, 'correct_answer': 'A', 'explanation': 'Perfect cubes: 1³, 2³, 3³, 4³, 5³ = 125.'},
+            {'question': 'If a sorting algorithm has O(n log n) complexity, how many operations for 1000 elements?', 'options': {'A': '~10000', 'B': '~1000', 'C': '~100000', 'D': '~1000000'}, 'correct_answer': 'A', 'explanation': '1000 × log₂(1000) ≈ 1000 × 10 = 10000.'},
+            {'question': 'In a binary tree with height h, what is the maximum number of nodes?', 'options': {'A': '2^(h+1) - 1', 'B': '2^h', 'C': 'h^2', 'D': '2h'}, 'correct_answer': 'A', 'explanation': 'Complete binary tree: 2^0 + 2^1 + ... + 2^h = 2^(h+1) - 1.'}
+        ],
+        'hard': [
+            {'question': 'In a distributed system with 5 nodes, if each node can fail independently with probability 0.1, what is the probability that exactly 2 nodes fail?', 'options': {'A': '0.0729', 'B': '0.0810', 'C': '0.0656', 'D': '0.0590'}, 'correct_answer': 'A', 'explanation': 'Binomial probability: C(5,2) × (0.1)² × (0.9)³ = 10 × 0.01 × 0.729 = 0.0729'},
+            {'question': 'A recursive algorithm has time complexity T(n) = 2T(n/2) + n. What is its Big O complexity?', 'options': {'A': 'O(n log n)', 'B': 'O(n²)', 'C': 'O(n)', 'D': 'O(log n)'}, 'correct_answer': 'A', 'explanation': 'Using Master Theorem: a=2, b=2, f(n)=n. Since n = n^log₂(2), complexity is O(n log n).'},
+            {'question': 'In a consistent hashing ring with 4 nodes, if one node fails, what percentage of keys need to be redistributed?', 'options': {'A': '25%', 'B': '50%', 'C': '75%', 'D': '100%'}, 'correct_answer': 'A', 'explanation': 'Only keys from the failed node (1/4 = 25%) need redistribution.'},
+            {'question': 'A B-tree of order m has minimum degree t = ⌈m/2⌉. For m=5, what is the minimum number of keys in a non-root node?', 'options': {'A': '2', 'B': '3', 'C': '4', 'D': '5'}, 'correct_answer': 'A', 'explanation': 'Minimum degree t = ⌈5/2⌉ = 3, so minimum keys = t-1 = 2.'},
+            {'question': 'In a load balancer using weighted round-robin with weights [3,1,2], what percentage of requests go to the first server?', 'options': {'A': '50%', 'B': '33%', 'C': '25%', 'D': '60%'}, 'correct_answer': 'A', 'explanation': 'Total weight = 3+1+2 = 6. First server gets 3/6 = 50%.'}
+        ]
+    },
+    'quantitative_aptitude': {
+        'easy': [
+            {'question': 'What is 25% of 80?', 'options': {'A': '20', 'B': '25', 'C': '15', 'D': '30'}, 'correct_answer': 'A', 'explanation': '25% of 80 = 0.25 × 80 = 20'},
+            {'question': 'If a software license costs $100 and there is a 15% discount, what is the final price?', 'options': {'A': '$85', 'B': '$90', 'C': '$95', 'D': '$80'}, 'correct_answer': 'A', 'explanation': '15% discount means pay 85%. $100 × 0.85 = $85'},
+            {'question': 'A team completes 3 features per sprint. How many features in 4 sprints?', 'options': {'A': '12', 'B': '10', 'C': '15', 'D': '9'}, 'correct_answer': 'A', 'explanation': '3 features/sprint × 4 sprints = 12 features'},
+            {'question': 'If 60% of tests pass, and there are 50 tests, how many fail?', 'options': {'A': '20', 'B': '25', 'C': '15', 'D': '30'}, 'correct_answer': 'A', 'explanation': '40% fail: 50 × 0.40 = 20 tests fail'},
+            {'question': 'What is 3/4 expressed as a percentage?', 'options': {'A': '75%', 'B': '70%', 'C': '80%', 'D': '65%'}, 'correct_answer': 'A', 'explanation': '3/4 = 0.75 = 75%'},
+            {'question': 'If a developer works 8 hours per day for 5 days, how many total hours?', 'options': {'A': '40', 'B': '35', 'C': '45', 'D': '30'}, 'correct_answer': 'A', 'explanation': '8 hours/day × 5 days = 40 hours'},
+            {'question': 'What is 12 × 15?', 'options': {'A': '180', 'B': '160', 'C': '200', 'D': '150'}, 'correct_answer': 'A', 'explanation': '12 × 15 = 180'},
+            {'question': 'If there are 24 hours in a day, how many minutes is that?', 'options': {'A': '1440', 'B': '1400', 'C': '1500', 'D': '1200'}, 'correct_answer': 'A', 'explanation': '24 hours × 60 minutes/hour = 1440 minutes'},
+            {'question': 'What is 50% of 200?', 'options': {'A': '100', 'B': '150', 'C': '75', 'D': '125'}, 'correct_answer': 'A', 'explanation': '50% of 200 = 0.5 × 200 = 100'},
+            {'question': 'If a project has 10 tasks and 3 are completed, what percentage is done?', 'options': {'A': '30%', 'B': '25%', 'C': '35%', 'D': '40%'}, 'correct_answer': 'A', 'explanation': '3/10 = 0.3 = 30%'}
+        ],
+        'medium': [
+            {'question': 'A server processes 1200 requests per minute. How many requests in 2.5 hours?', 'options': {'A': '180000', 'B': '150000', 'C': '200000', 'D': '160000'}, 'correct_answer': 'A', 'explanation': '2.5 hours = 150 minutes. 1200 × 150 = 180,000 requests'},
+            {'question': 'If API response time increases by 20% from 100ms, what is the new response time?', 'options': {'A': '120ms', 'B': '125ms', 'C': '115ms', 'D': '130ms'}, 'correct_answer': 'A', 'explanation': '20% increase: 100 + (100 × 0.20) = 120ms'},
+            {'question': 'A database query returns 500 records. If we paginate with 25 records per page, how many pages?', 'options': {'A': '20', 'B': '25', 'C': '15', 'D': '30'}, 'correct_answer': 'A', 'explanation': '500 ÷ 25 = 20 pages'},
+            {'question': 'If memory usage grows by 5% each day, starting at 100MB, what is it after 2 days?', 'options': {'A': '110.25MB', 'B': '110MB', 'C': '105MB', 'D': '115MB'}, 'correct_answer': 'A', 'explanation': 'Day 1: 100 × 1.05 = 105MB. Day 2: 105 × 1.05 = 110.25MB'},
+            {'question': 'A team of 6 developers can complete a project in 8 weeks. How long for 4 developers?', 'options': {'A': '12 weeks', 'B': '10 weeks', 'C': '14 weeks', 'D': '6 weeks'}, 'correct_answer': 'A', 'explanation': 'Total work = 6×8 = 48 dev-weeks. For 4 devs: 48÷4 = 12 weeks'}
+        ],
+        'hard': [
+            {'question': 'A system has 99.9% uptime. In a year (365 days), how many minutes of downtime is this?', 'options': {'A': '525.6', 'B': '432.5', 'C': '365.2', 'D': '876.0'}, 'correct_answer': 'A', 'explanation': 'Downtime = 0.1% of year = 0.001 × 365 × 24 × 60 = 525.6 minutes'},
+            {'question': 'If a cache has 95% hit rate and each miss costs 100ms while hits cost 1ms, what is average response time?', 'options': {'A': '5.95ms', 'B': '10ms', 'C': '50.5ms', 'D': '1ms'}, 'correct_answer': 'A', 'explanation': '0.95 × 1ms + 0.05 × 100ms = 0.95 + 5 = 5.95ms'}
+        ]
+    },
+    'verbal_reasoning': {
+        'easy': [
+            {'question': 'Choose the word most similar to "Debug":', 'options': {'A': 'Fix', 'B': 'Break', 'C': 'Code', 'D': 'Test'}, 'correct_answer': 'A', 'explanation': 'Debug means to find and fix errors, so "Fix" is most similar.'},
+            {'question': 'What is the opposite of "Compile"?', 'options': {'A': 'Decompile', 'B': 'Execute', 'C': 'Debug', 'D': 'Test'}, 'correct_answer': 'A', 'explanation': 'Compile converts source to machine code, decompile does the reverse.'},
+            {'question': 'Choose the synonym for "Implement":', 'options': {'A': 'Execute', 'B': 'Plan', 'C': 'Design', 'D': 'Think'}, 'correct_answer': 'A', 'explanation': 'Implement means to put into action or execute.'},
+            {'question': 'What does "Optimize" mean?', 'options': {'A': 'Make better/efficient', 'B': 'Make worse', 'C': 'Make complex', 'D': 'Make simple'}, 'correct_answer': 'A', 'explanation': 'Optimize means to make as effective or functional as possible.'},
+            {'question': 'Choose the antonym of "Secure":', 'options': {'A': 'Vulnerable', 'B': 'Protected', 'C': 'Safe', 'D': 'Encrypted'}, 'correct_answer': 'A', 'explanation': 'Secure means protected, vulnerable means exposed to danger.'}
+        ],
+        'medium': [
+            {'question': 'Complete the analogy: Code is to Program as Ingredient is to ?', 'options': {'A': 'Recipe', 'B': 'Kitchen', 'C': 'Cook', 'D': 'Food'}, 'correct_answer': 'A', 'explanation': 'Code makes up a program, just as ingredients make up a recipe.'},
+            {'question': 'Choose the word that best completes: "The API is _____ because it handles errors gracefully."', 'options': {'A': 'Robust', 'B': 'Fragile', 'C': 'Simple', 'D': 'Complex'}, 'correct_answer': 'A', 'explanation': 'Robust means strong and able to handle difficult conditions.'}
+        ],
+        'hard': [
+            {'question': 'If "Optimization improves performance" is true, and "Performance affects user experience" is true, what can we conclude?', 'options': {'A': 'Optimization affects user experience', 'B': 'User experience improves optimization', 'C': 'Performance equals optimization', 'D': 'Cannot determine relationship'}, 'correct_answer': 'A', 'explanation': 'Transitive property: Optimization → Performance → User Experience'}
+        ]
     }
+}
+
+# Flat (topic, difficulty) -> templates lookup so generation is a single dict access
+_TEMPLATES_BY_TOPIC_DIFF = {
+    (topic, difficulty): tuple(templates)
+    for topic, difficulties in _FALLBACK_TEMPLATES.items()
+    for difficulty, templates in difficulties.items()
+}
+
+# Shared by every fallback result - callers only read it
+_FALLBACK_METADATA = {'generated_by': 'fallback_templates', 'type': 'aptitude_fallback'}
+
+
+@lru_cache(maxsize=256)
+def _generic_topic_templates(topic: str) -> tuple:
+    """Create generic questions for topics without dedicated templates (built once per topic)"""
+    topic_name = topic.replace("_", " ")
+    return (
+        {'question': f'What is a fundamental concept in {topic_name}?', 'options': {'A': 'Basic principle', 'B': 'Advanced technique', 'C': 'Complex algorithm', 'D': 'Expert method'}, 'correct_answer': 'A', 'explanation': f'This tests basic understanding of {topic_name}.'},
+        {'question': f'Which is most important in {topic_name}?', 'options': {'A': 'Foundation knowledge', 'B': 'Advanced skills', 'C': 'Expert techniques', 'D': 'Complex theories'}, 'correct_answer': 'A', 'explanation': f'Foundation knowledge is most important in {topic_name}.'}
+    )
+
+def _topic_difficulty_questions(topic: str, difficulty: str, count: int, time_per_question: int):
+    """Lazily build `count` questions for one topic/difficulty, cycling through its templates"""
+    # Get templates for this topic or fall back to generic ones
+    available_templates = _TEMPLATES_BY_TOPIC_DIFF.get((topic, difficulty)) or _generic_topic_templates(topic)
+    template_count = len(available_templates)
     
-    # Generate questions based on topic_configs
-    all_questions = []
+    # One prefix per pass over the templates - the first pass is left as is
+    passes = -(-count // template_count) if template_count else 0
+    variation_prefixes = [''] + [f"[Variation {n + 1}] " for n in range(1, passes)]
     
-    for topic_config in topic_configs:
-        topic = topic_config['topic']
-        
-        # Get templates for this topic or create generic ones
-        if topic not in fallback_templates:
-            # Create generic questions for unknown topics
-            base_templates = {
-                'easy': [
-                    {'question': f'What is a fundamental concept in {topic.replace("_", " ")}?', 'options': {'A': 'Basic principle', 'B': 'Advanced technique', 'C': 'Complex algorithm', 'D': 'Expert method'}, 'correct_answer': 'A', 'explanation': f'This tests basic understanding of {topic.replace("_", " ")}.'},
-                    {'question': f'Which is most important in {topic.replace("_", " ")}?', 'options': {'A': 'Foundation knowledge', 'B': 'Advanced skills', 'C': 'Expert techniques', 'D': 'Complex theories'}, 'correct_answer': 'A', 'explanation': f'Foundation knowledge is most important in {topic.replace("_", " ")}.'}
-                ] * 10  # Repeat to get 20 questions
-            }
-            topic_templates = base_templates
-        else:
-            topic_templates = fallback_templates[topic]
-        
+    # Templates already hold question/options/correct_answer/explanation - merge in the per-call fields
+    # (variation prefix avoids exact duplicates)
+    return (
+        {
+            **template,
+            'topic': topic,
+            'question': variation_prefixes[i // template_count] + template['question'],
+            'options': dict(template['options']),
+            'difficulty': difficulty,
+            'time_limit': time_per_question
+        }
+        for i, template in enumerate(islice(cycle(available_templates), count))
+    )
+
+
+def _topic_signature(topic_configs: List[Dict]) -> tuple:
+    """Normalise topic configs once into hashable (topic, easy, medium, hard) tuples"""
+    return tuple(
+        (tc['topic'], tc.get('easy', 0), tc.get('medium', 0), tc.get('hard', 0))
+        for tc in topic_configs
+    )
+
+
+def _iter_signature_questions(topic_signature: tuple, time_per_question: int):
+    """Yield questions for a normalised topic signature"""
+    for topic, easy_count, medium_count, hard_count in topic_signature:
         # Generate questions for each difficulty
-        for difficulty in ['easy', 'medium', 'hard']:
-            count = topic_config.get(difficulty, 0)
-            if count > 0:
-                available_templates = topic_templates.get(difficulty, topic_templates.get('easy', []))
-                
-                # Extend templates if needed
-                while len(available_templates) < count:
-                    available_templates.extend(topic_templates.get(difficulty, topic_templates.get('easy', [])))
-                
-                # Select required number of questions
-                for i in range(count):
-                    template_index = i % len(available_templates)
-                    template = available_templates[template_index]
-                    
-                    # Add variation to avoid exact duplicates
-                    question_text = template['question']
-                    if i >= len(available_templates):
-                        variation_num = (i // len(available_templates)) + 1
-                        question_text = f"[Variation {variation_num}] {question_text}"
-                    
-                    question = {
-                        'topic': topic,
-                        'question': question_text,
-                        'options': template['options'].copy(),
-                        'correct_answer': template['correct_answer'],
-                        'difficulty': difficulty,
-                        'explanation': template['explanation'],
-                        'time_limit': time_per_question
-                    }
-                    all_questions.append(question)
+        if easy_count > 0:
+            yield from _topic_difficulty_questions(topic, 'easy', easy_count, time_per_question)
+        if medium_count > 0:
+            yield from _topic_difficulty_questions(topic, 'medium', medium_count, time_per_question)
+        if hard_count > 0:
+            yield from _topic_difficulty_questions(topic, 'hard', hard_count, time_per_question)
+
+
+def iter_fallback_aptitude_questions(topic_configs: List[Dict], time_per_question: int = 60):
+    """Yield fallback aptitude questions one at a time so callers can stop early"""
+    return _iter_signature_questions(_topic_signature(topic_configs), time_per_question)
+
+
+@lru_cache(maxsize=128)
+def _cached_fallback_questions(topic_signature: tuple, time_per_question: int) -> tuple:
+    """Build the questions for one normalised topic configuration (question dicts are shared - don't mutate)"""
+    return tuple(_iter_signature_questions(topic_signature, time_per_question))
+
+
+def get_fallback_aptitude_questions(topic_configs: List[Dict], time_per_question: int = 60, job_title: str = 'Software Developer') -> Dict[str, Any]:
+    """Generate fallback aptitude questions using comprehensive templates with 20+ unique questions per topic/difficulty"""
+    logger.info("📝 Using fallback templates for aptitude questions...")
+    
+    # Generate questions based on topic_configs - repeat configurations are served from cache.
+    # Callers get their own copies (options included) so edits to a question can't leak into later requests.
+    all_questions = [
+        {**question, 'options': dict(question['options'])}
+        for question in _cached_fallback_questions(_topic_signature(topic_configs), time_per_question)
+    ]
     
-    logger.info(f"✅ Generated {len(all_questions)} fallback aptitude questions")
+    logger.info("✅ Generated %d fallback aptitude questions", len(all_questions))
     
     return {
         'success': True,
         'questions': all_questions,
         'total_questions': len(all_questions),
-        'metadata': {'generated_by': 'fallback_templates', 'type': 'aptitude_fallback'}
+        'metadata': dict(_FALLBACK_METADATA)
     }
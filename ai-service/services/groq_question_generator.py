@@ -5,40 +5,320 @@ Get free API key: https://console.groq.com/
 """
 
 import os
+import re
+import sys
 import json
+import hashlib
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import time
-from typing import List, Dict, Any
+import random
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import cycle, islice
+from types import MappingProxyType
+from typing import List, Dict, Any, Tuple
 from supabase import create_client, Client
+from services.aptitude_fallback import get_fallback_aptitude_questions
 
 logger = logging.getLogger(__name__)
 
+# Ask the model for per-question grammar explanations. On by default - the backend stores them in
+# interview_questions.explanation; turning this off saves output tokens but leaves that column empty.
+INCLUDE_EXPLANATIONS = True
+
+# Outermost [...] span of a model reply - tolerates ```json fences and surrounding prose
+_JSON_ARRAY = re.compile(r'\[.*\]', re.S)
+
+
+def _extract_json_array(content: str) -> list:
+    """Parse the JSON array embedded in a model reply, returning [] when there isn't a valid one"""
+    match = _JSON_ARRAY.search(content)
+    if not match:
+        logger.warning("⚠️ No JSON array found in AI response")
+        return []
+    try:
+        data = orjson.loads(match.group(0))
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"⚠️ Could not parse JSON array from AI response: {str(e)}")
+        return []
+    return data if isinstance(data, list) else []
+
+
+def _extract_questions(content: str) -> list:
+    """Parse the "questions" list from a JSON-mode reply, falling back to the outermost [...] span"""
+    try:
+        data = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return _extract_json_array(content)
+    if isinstance(data, dict):
+        data = data.get('questions')
+    return data if isinstance(data, list) else []
+
+
+# Largest completion the GROQ chat models will generate
+_MAX_COMPLETION_TOKENS = 8000
+
+
+def _completion_budget(count: int, tokens_per_question: int, overhead: int) -> int:
+    """max_tokens sized to the number of requested questions, capped at the model's ceiling"""
+    return min(tokens_per_question * count + overhead, _MAX_COMPLETION_TOKENS)
+
+
+# Invariant instructions live in the system message so every request shares an identical
+# prefix (provider-side prompt caching); only job title and counts go in the user message.
+_LISTENING_BATCH_SYSTEM_PROMPT = """You are an expert assessment creator. Generate unique, professional listening sentences in valid JSON format only.
+
+Difficulty levels:
+- EASY sentences: 8-12 words, simple vocabulary, basic concepts
+- MEDIUM sentences: 12-16 words, moderate vocabulary, intermediate concepts
+- HARD sentences: 16-20 words, advanced vocabulary, sophisticated concepts
+
+Requirements:
+- Each sentence should be completely unique and different
+- Content should be relevant to the job role in the request
+- Sentences should test listening comprehension and repetition accuracy
+- Use professional, clear language
+- Make each sentence realistic and engaging
+
+Return ONLY a JSON object with this exact structure:
+{
+  "questions": [
+    {"difficulty": "easy", "sentence": "First easy sentence about software development."},
+    {"difficulty": "easy", "sentence": "Second easy sentence with different content."},
+    {"difficulty": "medium", "sentence": "First medium sentence with moderate complexity and length."},
+    {"difficulty": "hard", "sentence": "First hard sentence with advanced concepts and sophisticated vocabulary structure."}
+  ]
+}"""
+
+_GRAMMAR_BATCH_SYSTEM_PROMPT = """You are an expert grammar assessment creator. Generate unique, professional grammar questions in valid JSON format only.
+
+Requirements:
+- Each question should test the specified grammar topic
+- Questions should be relevant to the job role's work context
+- Provide 4 options (A, B, C, D) for each question
+- Make each question completely unique and different
+- Use professional language appropriate for difficulty level
+
+Difficulty Guidelines:
+- Easy: Basic grammar rules, simple examples
+- Medium: Intermediate grammar usage, moderate complexity
+- Hard: Advanced grammar concepts, complex scenarios
+
+Return ONLY a JSON object with this exact structure:
+{
+  "questions": [
+    {
+      "topic": "tenses",
+      "difficulty": "easy", 
+      "question": "Which sentence uses the correct present perfect tense?",
+      "options": {
+        "A": "I have completed the project yesterday.",
+        "B": "I completed the project yesterday.", 
+        "C": "I have completed the project.",
+        "D": "I am completing the project yesterday."
+      },
+      "correct_answer": "C",
+      "explanation": "Present perfect tense is used for actions completed at an unspecified time."
+    }
+  ]
+}"""
+
+
+def _without_explanations(prompt: str) -> str:
+    """Drop the explanation field from a prompt's JSON example and tell the model to leave it out"""
+    prompt = re.sub(r',\n\s*"explanation": "[^"]*"', '', prompt)
+    return prompt.replace('\n\nDifficulty Guidelines:', '\n- Do not include an explanation field\n\nDifficulty Guidelines:', 1)
+
+
+if not INCLUDE_EXPLANATIONS:
+    _GRAMMAR_BATCH_SYSTEM_PROMPT = _without_explanations(_GRAMMAR_BATCH_SYSTEM_PROMPT)
+
+
+# Shared system messages for the reading, listening and grammar paths - built once so every request
+# carries the identical object instead of a fresh dict per call
+_READING_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": "You are an expert assessment creator. Generate unique, professional reading passages in valid JSON format only."}
+_LISTENING_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": _LISTENING_BATCH_SYSTEM_PROMPT}
+_GRAMMAR_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": _GRAMMAR_BATCH_SYSTEM_PROMPT}
+
+# System messages for the incremental small-batch helpers
+_READING_SMALL_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": "You are an expert assessment creator. Generate unique reading passages in valid JSON format only."}
+_LISTENING_SMALL_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": "You are an expert assessment creator. Generate unique listening sentences in valid JSON format only."}
+_GRAMMAR_SMALL_BATCH_SYSTEM_MESSAGE = {"role": "system", "content": "You are an expert grammar assessment creator. Generate unique grammar questions in valid JSON format only."}
+
+# Shared evaluation criteria - immutable, so every generated question can reference the same tuple
+_LISTEN_CRITERIA = ('accuracy', 'pronunciation', 'fluency')
+_GRAMMAR_CRITERIA = ('grammatical_accuracy', 'language_knowledge')
+_READ_CRITERIA = ('pronunciation', 'fluency', 'pace', 'clarity')
+
+# Seconds allowed per question by difficulty (unrecognised difficulties get the hard limit)
+_TIME_LIMITS = {'easy': 60, 'medium': 90, 'hard': 120}
+_READING_TIME_LIMITS = {'easy': 120, 'medium': 180, 'hard': 240}
+
+# Template fallback question prototypes per difficulty. Varying keys are None placeholders so
+# {**prototype, ...} keeps the original field order.
+_LISTENING_TEMPLATE_PROTOTYPES = {
+    difficulty: {
+        'title': None,
+        'content': 'Listen to the sentence and repeat it exactly as you heard it.',
+        'audio_text': None,
+        'skill': 'listening',
+        'subtype': 'sentence',
+        'type': 'listening',
+        'difficulty': difficulty,
+        'time_limit': time_limit,
+        'evaluation_criteria': _LISTEN_CRITERIA,
+        'instructions': 'Listen carefully, then repeat exactly as you heard it.'
+    }
+    for difficulty, time_limit in _TIME_LIMITS.items()
+}
+
+_GRAMMAR_TEMPLATE_PROTOTYPES = {
+    difficulty: {
+        'title': None,
+        'content': None,
+        'options': None,
+        'correct_answer': None,
+        'skill': 'grammar',
+        'type': 'grammar',
+        'topic': None,
+        'difficulty': difficulty,
+        'time_limit': time_limit,
+        'evaluation_criteria': _GRAMMAR_CRITERIA,
+        'instructions': 'Select the most grammatically correct option.'
+    }
+    for difficulty, time_limit in _TIME_LIMITS.items()
+}
+
+_READING_TEMPLATE_PROTOTYPES = {
+    difficulty: {
+        'title': None,
+        'content': 'Please read the following passage aloud clearly and naturally.',
+        'passage': None,
+        'skill': 'reading',
+        'type': 'reading_aloud',
+        'difficulty': difficulty,
+        'time_limit': time_limit,
+        'evaluation_criteria': _READ_CRITERIA,
+        'instructions': 'Read the paragraph aloud at a natural pace.'
+    }
+    for difficulty, time_limit in _READING_TIME_LIMITS.items()
+}
+
+
+# Grammar template fallback questions per topic and difficulty. Kept as a data file and loaded on
+# first use so importing this module doesn't build hundreds of dicts that most runs never touch.
+_GRAMMAR_TEMPLATES_PATH = os.path.join(os.path.dirname(__file__), 'templates', 'grammar_templates.json')
+
+
+def _intern_template(template: Dict) -> Dict:
+    """Intern a template's keys and strings ('question', 'A'-'D', answers like 'in'), which repeat across templates"""
+    return {
+        sys.intern(key): (
+            {sys.intern(option): sys.intern(text) for option, text in value.items()} if isinstance(value, dict)
+            else sys.intern(value) if isinstance(value, str)
+            else value
+        )
+        for key, value in template.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _grammar_templates() -> MappingProxyType:
+    """Read-only grammar templates by topic, then difficulty - shared by every call"""
+    with open(_GRAMMAR_TEMPLATES_PATH, 'rb') as f:
+        templates = orjson.loads(f.read())
+    return MappingProxyType({
+        topic: MappingProxyType({
+            difficulty: tuple(_intern_template(template) for template in questions)
+            for difficulty, questions in by_difficulty.items()
+        })
+        for topic, by_difficulty in templates.items()
+    })
+
+
+@lru_cache(maxsize=None)
+def _grammar_templates_flat() -> MappingProxyType:
+    """The same templates keyed by (topic, difficulty) for single-lookup access in the builder"""
+    return MappingProxyType({
+        (topic, difficulty): questions
+        for topic, by_difficulty in _grammar_templates().items()
+        for difficulty, questions in by_difficulty.items()
+    })
+
+
 class GroqQuestionGenerator:
     """Ultra-fast question generation using GROQ API"""
     
     def __init__(self):
         # Load multiple API keys for rotation
         self.api_keys = []
+        seen_keys = set()
         
         # Primary API key
         primary_key = os.getenv('GROQ_API_KEY')
         if primary_key:
             self.api_keys.append(primary_key)
+            seen_keys.add(primary_key)
         
         # Additional API keys from comma-separated list
         additional_keys = os.getenv('GROQ_API_KEYS', '')
         if additional_keys:
             keys_list = [key.strip() for key in additional_keys.split(',') if key.strip()]
-            # Remove duplicates and add to list
+            # Remove duplicates (keeping first-seen order) and add to list
             for key in keys_list:
-                if key not in self.api_keys:
+                if key not in seen_keys:
+                    seen_keys.add(key)
                     self.api_keys.append(key)
         
         self.current_key_index = 0
+        # Request headers built once per key instead of on every call
+        self._headers_for_key = {
+            key: {"Authorization": f"Bearer {key}", "Content-Type": "application/json"}
+            for key in self.api_keys
+        }
+        # Per-key cooldowns (key -> earliest time it may be used again) guarded by a lock for concurrent workers
+        self._key_lock = threading.Lock()
+        self._key_available_at = {}
+        # Per-key sliding-window limiter replacing fixed sleeps between calls (0 = unlimited)
+        self.requests_per_minute = int(os.getenv('GROQ_REQUESTS_PER_MINUTE', '30'))
+        # Optional per-key token budget (estimated prompt + max_tokens per request, 0 = unlimited)
+        self.tokens_per_minute = int(os.getenv('GROQ_TOKENS_PER_MINUTE', '0'))
+        self._key_windows = {}  # key -> deque of (timestamp, estimated tokens)
         self.api_base = "https://api.groq.com/openai/v1"
         # Use fastest model for question generation
         self.model = os.getenv('GROQ_MODEL', 'llama-3.1-70b-versatile')
+        # Optional in-process cache of successful completions keyed by request body (seconds, 0 = off).
+        # Off by default - repeated prompts would otherwise get identical questions back.
+        self.response_cache_ttl = int(os.getenv('GROQ_RESPONSE_CACHE_TTL', '0'))
+        self.response_cache_size = int(os.getenv('GROQ_RESPONSE_CACHE_SIZE', '512'))
+        self._response_cache = OrderedDict()  # LRU order - least recently used first
+        
+        # Persistent HTTP session so GROQ and backend calls reuse pooled keep-alive connections.
+        # Transient 5xx errors are retried with backoff for POSTs too; 429s are left to the caller
+        # so it can rotate API keys instead of retrying the same one, and the last response is
+        # returned (not raised) so the existing status handling still runs. Read errors are never
+        # retried - a timed-out completion may still be running and would be generated (and billed) again.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                read=0,
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=frozenset({'GET', 'POST'}),
+                raise_on_status=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         
         # Initialize Supabase client for database operations
         supabase_url = os.getenv('SUPABASE_URL')
@@ -88,42 +368,146 @@ class GroqQuestionGenerator:
             logger.warning("⚠️ No additional API keys available for rotation")
             return False
         
-        old_index = self.current_key_index
-        self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
+        # Same lock as acquire_api_key so a rotation can't interleave with concurrent workers
+        with self._key_lock:
+            old_index = self.current_key_index
+            self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
+            new_index = self.current_key_index
         
-        logger.info(f"🔄 Rotated API key from index {old_index} to {self.current_key_index}")
+        logger.info(f"🔄 Rotated API key from index {old_index} to {new_index}")
         return True
 
+    def acquire_api_key(self, estimated_tokens: int = 0):
+        """Hand out API keys round-robin, skipping keys that are cooling down or at their per-minute limits"""
+        if not self.api_keys:
+            return None
+        
+        while True:
+            with self._key_lock:
+                now = time.time()
+                wait_until = None
+                for offset in range(len(self.api_keys)):
+                    index = (self.current_key_index + offset) % len(self.api_keys)
+                    api_key = self.api_keys[index]
+                    
+                    # Sliding one-minute window of (timestamp, tokens) for this key
+                    window = self._key_windows.setdefault(api_key, deque())
+                    while window and now - window[0][0] >= 60:
+                        window.popleft()
+                    
+                    available_at = self._key_available_at.get(api_key, 0)
+                    if self.requests_per_minute > 0 and len(window) >= self.requests_per_minute:
+                        available_at = max(available_at, window[0][0] + 60)
+                    if self.tokens_per_minute > 0 and window:
+                        # Wait until enough old requests age out to fit this one (an empty window always fits)
+                        excess = sum(tokens for _, tokens in window) + estimated_tokens - self.tokens_per_minute
+                        for sent_at, tokens in window:
+                            if excess <= 0:
+                                break
+                            excess -= tokens
+                            available_at = max(available_at, sent_at + 60)
+                    
+                    if available_at <= now:
+                        window.append((now, estimated_tokens))
+                        # Advance past this key so concurrent callers get distinct keys
+                        self.current_key_index = (index + 1) % len(self.api_keys)
+                        return api_key
+                    
+                    wait_until = available_at if wait_until is None else min(wait_until, available_at)
+            
+            # Every key is throttled - wait (outside the lock) for the first one to free up
+            logger.info(f"⏳ All API keys throttled, waiting {wait_until - now:.1f}s...")
+            time.sleep(max(0.0, wait_until - time.time()))
+    
+    def mark_api_key_rate_limited(self, api_key: str, retry_after: float = None):
+        """Put a rate limited key on cooldown for retry_after seconds (30s when GROQ doesn't say)"""
+        with self._key_lock:
+            self._key_available_at[api_key] = time.time() + (retry_after or 30)
+    
+    @staticmethod
+    def _estimate_tokens(payload: Dict, body: bytes) -> int:
+        """Rough token cost of a request: ~4 bytes per prompt token plus the completion budget"""
+        return len(body) // 4 + payload.get('max_tokens', 0)
+
+    def _post_chat_completion(self, payload: Dict, timeout: int = 30):
+        """POST a chat completion, retrying a 429 on the next available API key"""
+        body = orjson.dumps(payload)
+        cache_key = None
+        if self.response_cache_ttl > 0:
+            cache_key = hashlib.blake2b(body, digest_size=16).digest()
+            with self._key_lock:
+                cached = self._response_cache.get(cache_key)
+                if cached:
+                    self._response_cache.move_to_end(cache_key)
+            if cached and cached[0] > time.time():
+                logger.info("⚡ Using cached GROQ response")
+                return cached[1]
+        
+        estimated_tokens = self._estimate_tokens(payload, body)
+        if self.tokens_per_minute > 0 and estimated_tokens > self.tokens_per_minute:
+            # Still sent, but only once a key's window is empty - raise GROQ_TOKENS_PER_MINUTE above the largest request
+            logger.warning(f"⚠️ Request needs ~{estimated_tokens} tokens, over the {self.tokens_per_minute}/min budget per key")
+        response = None
+        for attempt in range(max(1, len(self.api_keys))):
+            api_key = self.acquire_api_key(estimated_tokens)
+            response = self.session.post(
+                f"{self.api_base}/chat/completions",
+                headers=self._headers_for_key[api_key],
+                data=body,
+                timeout=timeout
+            )
+            if response.status_code != 429:
+                if cache_key and response.status_code == 200:
+                    self._cache_response(cache_key, response)
+                return response
+            
+            try:
+                retry_after = float(response.headers.get('retry-after', ''))
+            except ValueError:
+                # No usable Retry-After - back off exponentially with jitter so workers don't retry in lockstep
+                retry_after = min(30, 2 ** (attempt + 1)) + random.uniform(0, 1)
+            self.mark_api_key_rate_limited(api_key, retry_after)
+            logger.warning("⚠️ Rate limited (429), retrying with the next available API key...")
+        
+        return response
+
+    def _cache_response(self, cache_key: bytes, response):
+        """Store a successful completion, dropping expired entries and evicting least recently used ones"""
+        now = time.time()
+        with self._key_lock:
+            for key in [key for key, (expires_at, _) in self._response_cache.items() if expires_at <= now]:
+                del self._response_cache[key]
+            self._response_cache[cache_key] = (now + self.response_cache_ttl, response)
+            self._response_cache.move_to_end(cache_key)
+            while len(self._response_cache) > self.response_cache_size:
+                self._response_cache.popitem(last=False)
+
     def _check_existing_questions(self, topic_configs: List[Dict]) -> Dict[str, Dict[str, int]]:
         """Check existing questions in database and return counts by topic and difficulty"""
         if not self.supabase:
             logger.warning("⚠️ No database connection - cannot check existing questions")
             return {}
         
+        # Cleared up front so a failed check never leaves the previous request's data behind
+        self.existing_question_hashes = {}
+        self.existing_questions_content = {}
+        
         try:
-            existing_counts = {}
-            self.existing_questions_content = {}  # Store existing question content for duplicate checking
+            topics = [topic_config['topic'] for topic_config in topic_configs]
             
-            for topic_config in topic_configs:
-                topic = topic_config['topic']
-                existing_counts[topic] = {'easy': 0, 'medium': 0, 'hard': 0}
-                self.existing_questions_content[topic] = []
-                
-                # Query existing questions for this topic (get full content for duplicate checking)
-                response = self.supabase.table('aptitude_questions').select('difficulty, question_text').eq('topic', topic).execute()
-                
-                if response.data:
-                    # Count questions by difficulty and store content
-                    for question in response.data:
-                        difficulty = question.get('difficulty', 'medium')
-                        if difficulty in existing_counts[topic]:
-                            existing_counts[topic][difficulty] += 1
-                        
-                        # Store question text for duplicate checking
-                        question_text = question.get('question_text', '').lower().strip()
-                        if question_text:
-                            self.existing_questions_content[topic].append(question_text)
-                
+            try:
+                # Server-side aggregation: counts, text hashes and a few samples per topic/difficulty
+                existing_counts, question_hashes, question_samples = self._load_existing_question_stats(topics)
+            except Exception as e:
+                # get_question_stats not deployed yet - read the question texts directly. Loaders build
+                # fresh dicts, so a half-read RPC result never leaks into these counts.
+                logger.warning(f"⚠️ get_question_stats RPC unavailable, loading question texts instead: {str(e)}")
+                existing_counts, question_hashes, question_samples = self._load_existing_question_texts(topics)
+            
+            self.existing_question_hashes = question_hashes  # Hashed question texts per topic for O(1) duplicate checks
+            self.existing_questions_content = question_samples  # A few existing question texts per topic, shown to the AI as examples
+            
+            for topic in topics:
                 logger.info(f"📊 Existing {topic}: {existing_counts[topic]} (content stored for duplicate check)")
             
             return existing_counts
@@ -132,6 +516,69 @@ class GroqQuestionGenerator:
             logger.error(f"❌ Error checking existing questions: {str(e)}")
             return {}
 
+    @staticmethod
+    def _empty_question_stats(topics: List[str]) -> Tuple[Dict[str, Dict[str, int]], Dict[str, set], Dict[str, List[str]]]:
+        """Zeroed counts, hash sets and sample lists for each topic"""
+        return (
+            {topic: {'easy': 0, 'medium': 0, 'hard': 0} for topic in topics},
+            {topic: set() for topic in topics},
+            {topic: [] for topic in topics}
+        )
+
+    def _load_existing_question_stats(self, topics: List[str]):
+        """Counts, hashes and samples from the get_question_stats RPC (backend/migrations/create_question_stats_function.sql)"""
+        response = self.supabase.rpc('get_question_stats', {'topics': topics}).execute()
+        existing_counts, question_hashes, question_samples = self._empty_question_stats(topics)
+        
+        for row in response.data or []:
+            topic = row.get('topic')
+            if topic not in existing_counts:
+                continue
+            
+            difficulty = row.get('difficulty', 'medium')
+            if difficulty in existing_counts[topic]:
+                existing_counts[topic][difficulty] += row.get('cnt', 0)
+            
+            question_hashes[topic].update(bytes.fromhex(digest) for digest in row.get('hashes') or [])
+            samples = question_samples[topic]
+            samples.extend((row.get('samples') or [])[:3 - len(samples)])
+        
+        return existing_counts, question_hashes, question_samples
+
+    def _load_existing_question_texts(self, topics: List[str]):
+        """Counts, hashes and samples built by downloading every question text in one query"""
+        response = self.supabase.table('aptitude_questions').select('topic, difficulty, question_text').in_('topic', topics).execute()
+        existing_counts, question_hashes, question_samples = self._empty_question_stats(topics)
+        
+        # Count questions by topic and difficulty and store content
+        for question in response.data or []:
+            topic = question.get('topic')
+            if topic not in existing_counts:
+                continue
+            
+            difficulty = question.get('difficulty', 'medium')
+            if difficulty in existing_counts[topic]:
+                existing_counts[topic][difficulty] += 1
+            
+            # Hash question text for duplicate checking, keeping only a few samples as text
+            question_text = question.get('question_text') or ''
+            if question_text.strip():
+                question_hashes[topic].add(self._question_digest(question_text))
+                if len(question_samples[topic]) < 3:
+                    question_samples[topic].append(question_text.lower().strip())
+        
+        return existing_counts, question_hashes, question_samples
+
+    @staticmethod
+    def _question_digest(question_text: str) -> bytes:
+        """8-byte sha256 of the canonical text (UTF-8, ASCII whitespace trimmed, ASCII-only lowercase) - matches get_question_stats"""
+        return hashlib.sha256(question_text.encode('utf-8').strip().lower()).digest()[:8]
+
+    def _is_duplicate(self, topic: str, question_text: str) -> bool:
+        """Check a question text against the existing questions loaded for its topic"""
+        topic_hashes = getattr(self, 'existing_question_hashes', {}).get(topic)
+        return bool(topic_hashes) and self._question_digest(question_text) in topic_hashes
+
     def _calculate_missing_questions(self, topic_configs: List[Dict], existing_counts: Dict[str, Dict[str, int]]) -> List[Dict]:
         """Calculate only the missing questions needed to reach target"""
         missing_configs = []
@@ -175,61 +622,44 @@ class GroqQuestionGenerator:
                 for topic_config in topic_questions.values():
                     target_total += topic_config.get('easy', 0) + topic_config.get('medium', 0) + topic_config.get('hard', 0)
             
-            # Check existing questions if application_id provided
-            existing_count = 0
+            # Fetch existing questions once - used both for progress counting and deduplication
+            existing_questions = []
             if application_id:
                 try:
                     backend_url = "http://localhost:3000"
-                    response = requests.get(f"{backend_url}/api/applications/{application_id}/questions", 
+                    response = self.session.get(f"{backend_url}/api/applications/{application_id}/questions", 
                                           params={'type': 'communication'})
                     if response.status_code == 200:
-                        existing_questions = response.json().get('questions', [])
-                        existing_count = len(existing_questions)
-                        logger.info(f"📊 Found {existing_count} existing communication questions")
+                        existing_questions = orjson.loads(response.content).get('questions', [])
+                        logger.info(f"📊 Found {len(existing_questions)} existing communication questions")
                     else:
                         logger.warning(f"⚠️ Could not fetch existing questions: HTTP {response.status_code}")
                 except Exception as e:
                     logger.warning(f"⚠️ Could not check existing questions: {str(e)}")
+            existing_count = len(existing_questions)
             
             # Generate one batch (try reading first, then listening, then grammar)
             all_questions = []
+            estimated_time = 0
             batch_size = min(10, target_total - existing_count)  # Generate up to 10 questions per batch
             
-            # Get existing questions to avoid duplicates
-            existing_questions = []
-            if application_id:
-                try:
-                    backend_url = "http://localhost:3000"
-                    response = requests.get(f"{backend_url}/api/applications/{application_id}/questions", 
-                                          params={'type': 'communication'})
-                    if response.status_code == 200:
-                        existing_questions = response.json().get('questions', [])
-                        logger.info(f"📋 Found {len(existing_questions)} existing questions for deduplication")
-                except Exception as e:
-                    logger.warning(f"⚠️ Could not fetch existing questions for deduplication: {str(e)}")
-            
-            # Try reading questions first
-            if 'reading' in skills and len(all_questions) < batch_size:
-                reading_questions = self._generate_small_reading_batch(reading_config, job_title, batch_size, existing_questions + all_questions)
-                all_questions.extend(reading_questions)
-                if reading_questions:  # Add delay if questions were generated
-                    import time
-                    time.sleep(2)  # 2 second delay between API calls
-            
-            # Then listening if we still need more
-            if 'listening' in skills and len(all_questions) < batch_size:
-                remaining = batch_size - len(all_questions)
-                listening_questions = self._generate_small_listening_batch(listening_config, job_title, remaining, existing_questions + all_questions)
-                all_questions.extend(listening_questions)
-                if listening_questions:  # Add delay if questions were generated
-                    import time
-                    time.sleep(2)  # 2 second delay between API calls
-            
-            # Finally grammar if we still need more
-            if 'grammar' in skills and len(all_questions) < batch_size:
+            # Fill the batch reading -> listening -> grammar, asking each skill only for the slots still open
+            # so no GROQ call or template is spent on questions that would be thrown away
+            batch_jobs = []
+            if 'reading' in skills:
+                batch_jobs.append((self._generate_small_reading_batch, reading_config))
+            if 'listening' in skills:
+                batch_jobs.append((self._generate_small_listening_batch, listening_config))
+            if 'grammar' in skills:
+                batch_jobs.append((self._generate_small_grammar_batch, grammar_config))
+            
+            for generate_batch, config in batch_jobs:
                 remaining = batch_size - len(all_questions)
-                grammar_questions = self._generate_small_grammar_batch(grammar_config, job_title, remaining, existing_questions + all_questions)
-                all_questions.extend(grammar_questions)
+                if remaining <= 0:
+                    break
+                batch_questions = generate_batch(config, job_title, remaining, existing_questions + all_questions)
+                all_questions.extend(batch_questions)
+                estimated_time += sum(question.get('time_limit', 120) for question in batch_questions)
             
             # Calculate progress
             new_total = existing_count + len(all_questions)
@@ -255,7 +685,7 @@ class GroqQuestionGenerator:
                     'is_complete': is_complete
                 },
                 'user_guidance': user_guidance,
-                'estimated_time': sum(q.get('time_limit', 120) for q in all_questions),
+                'estimated_time': estimated_time,
                 'skills_tested': skills,
                 'metadata': {'generated_by': 'groq_incremental', 'type': 'communication_incremental'}
             }
@@ -273,30 +703,32 @@ class GroqQuestionGenerator:
         
         try:
             questions = []
+            estimated_time = 0
             
-            # BATCH GENERATION - Single API call per skill type
-            
-            # Generate Reading Questions in one batch
+            # BATCH GENERATION - Single API call per skill type, dispatched concurrently
+            batch_jobs = []
             if 'reading' in skills and reading_config:
-                reading_questions = self._batch_generate_reading_questions(reading_config, job_title)
-                questions.extend(reading_questions)
-            
-            # Generate Listening Questions in one batch
+                batch_jobs.append((self._batch_generate_reading_questions, reading_config))
             if 'listening' in skills and listening_config:
-                listening_questions = self._batch_generate_listening_questions(listening_config, job_title)
-                questions.extend(listening_questions)
-            
-            # Generate Grammar Questions in one batch
+                batch_jobs.append((self._batch_generate_listening_questions, listening_config))
             if 'grammar' in skills and grammar_config:
-                grammar_questions = self._batch_generate_grammar_questions(grammar_config, job_title)
-                questions.extend(grammar_questions)
+                batch_jobs.append((self._batch_generate_grammar_questions, grammar_config))
+            
+            if batch_jobs:
+                with ThreadPoolExecutor(max_workers=len(batch_jobs)) as executor:
+                    futures = [executor.submit(fn, cfg, job_title) for fn, cfg in batch_jobs]
+                    # Collect in submission order so reading/listening/grammar ordering is preserved
+                    for future in futures:
+                        for question in future.result():
+                            questions.append(question)
+                            estimated_time += question.get('time_limit', 120)
             
             logger.info(f"✅ Generated {len(questions)} structured communication questions")
             return {
                 'success': True,
                 'questions': questions,
                 'total_questions': len(questions),
-                'estimated_time': sum(q.get('time_limit', 120) for q in questions),
+                'estimated_time': estimated_time,
                 'skills_tested': skills,
                 'metadata': {'generated_by': 'groq', 'type': 'structured_communication'}
             }
@@ -305,120 +737,35 @@ class GroqQuestionGenerator:
             logger.error(f"❌ Error generating structured communication assessment: {str(e)}")
             return self._get_fallback_structured_communication(reading_config, listening_config, grammar_config, skills)
 
-    def _generate_reading_questions(self, reading_config: Dict, job_title: str) -> List[Dict]:
-        """Generate reading assessment questions using AI ONLY - no fallback templates"""
-        
-        if not self.api_keys:
-            logger.error("❌ No GROQ API key - cannot generate AI reading questions")
-            return [{
-                'title': 'AI Generation Error',
-                'content': 'AI service unavailable - no GROQ API key configured',
-                'passage': 'ERROR: AI not able to generate content. Please configure GROQ API key.',
-                'skill': 'reading',
-                'type': 'error',
-                'difficulty': 'error',
-                'time_limit': 60,
-                'error': True
-            }]
-        
-        # Use ONLY AI generation - no templates
-        return self._ai_generate_reading_questions(reading_config, job_title)
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _reading_prompt_for(job_title: str, easy: int, medium: int, hard: int) -> str:
+        """Batch reading prompt (cached - identical configs reuse the same text)"""
+        return f"""Generate exactly {easy + medium + hard} unique reading passages for a {job_title} communication assessment.
 
-    def _ai_generate_reading_questions(self, reading_config: Dict, job_title: str) -> List[Dict]:
-        """Generate reading questions using AI instead of templates"""
-        questions = []
-        import time
-        
-        for difficulty in ['easy', 'medium', 'hard']:
-            count = reading_config.get(difficulty, 0)
-            if count > 0:
-                logger.info(f"🤖 Generating {count} {difficulty} reading passages using AI...")
-                
-                # Create AI prompt for reading passages
-                prompt = f"""Generate {count} unique reading passages for a {job_title} communication assessment.
+BREAKDOWN REQUIRED:
+- {easy} EASY passages (simple vocabulary, 3-4 sentences, basic concepts)
+- {medium} MEDIUM passages (moderate vocabulary, 4-5 sentences, intermediate concepts)  
+- {hard} HARD passages (advanced vocabulary, 5-6 sentences, sophisticated concepts)
 
-Difficulty: {difficulty}
 Requirements:
-- Each passage should be 3-4 sentences long
+- Each passage should be completely unique and different
 - Content should be relevant to {job_title} work
 - Passages should test pronunciation, fluency, and clarity
-- Make each passage completely unique and different
-- Use professional, clear language appropriate for {difficulty} level
-
-Difficulty Guidelines:
-- Easy: Simple vocabulary, short sentences, basic concepts
-- Medium: Moderate vocabulary, complex sentences, intermediate concepts  
-- Hard: Advanced vocabulary, complex sentences, sophisticated concepts
+- Use professional, clear language
+- Make each passage engaging and realistic
 
-Return ONLY a JSON array of passages like this:
-[
-  "First unique passage about {job_title} work...",
-  "Second completely different passage...",
-  "Third unique passage with different content..."
-]"""
+Return ONLY a JSON object with this exact structure:
+{{
+  "questions": [
+    {{"difficulty": "easy", "passage": "First easy passage about software development..."}},
+    {{"difficulty": "easy", "passage": "Second easy passage with different content..."}},
+    {{"difficulty": "medium", "passage": "First medium passage with moderate complexity..."}},
+    {{"difficulty": "hard", "passage": "First hard passage with advanced concepts..."}}
+  ]
+}}
 
-                try:
-                    response = requests.post(
-                        f"{self.api_base}/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {self.get_current_api_key()}",
-                            "Content-Type": "application/json"
-                        },
-                        json={
-                            "model": self.model,
-                            "messages": [
-                                {"role": "system", "content": "You are an expert assessment creator. Generate unique, professional reading passages. Return only valid JSON."},
-                                {"role": "user", "content": prompt}
-                            ],
-                            "temperature": 0.8,  # Higher creativity for unique content
-                            "max_tokens": 1000
-                        },
-                        timeout=30
-                    )
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        content = result['choices'][0]['message']['content'].strip()
-                        
-                        # Parse the JSON array of passages
-                        passages = json.loads(content)
-                        
-                        # Validate exact count - trim if too many, warn if too few
-                        if len(passages) > count:
-                            logger.warning(f"⚠️ AI generated {len(passages)} {difficulty} reading passages, expected {count}. Trimming to exact count.")
-                            passages = passages[:count]
-                        elif len(passages) < count:
-                            logger.warning(f"⚠️ AI generated {len(passages)} {difficulty} reading passages, expected {count}. Using what was generated.")
-                        
-                        # Convert to question format
-                        for i, passage in enumerate(passages):
-                            time_limit = 120 if difficulty == 'easy' else 180 if difficulty == 'medium' else 240
-                            
-                            questions.append({
-                                'title': f'Reading Assessment - {difficulty.title()} Level',
-                                'content': 'Please read the following passage aloud clearly and naturally.',
-                                'passage': passage,
-                                'skill': 'reading',
-                                'type': 'reading_aloud',
-                                'difficulty': difficulty,
-                                'time_limit': time_limit,
-                                'evaluation_criteria': ['pronunciation', 'fluency', 'pace', 'clarity'],
-                                'instructions': 'Read the paragraph aloud at a natural pace. Focus on clear pronunciation and proper intonation.'
-                            })
-                        
-                        logger.info(f"✅ AI generated {len(passages)} unique {difficulty} reading passages (requested: {count})")
-                        
-                        # Add delay to avoid rate limits
-                        time.sleep(0.5)
-                    else:
-                        logger.error(f"❌ AI generation failed for {difficulty} reading: {response.status_code}")
-                        logger.info(f"⚠️ Skipping {count} {difficulty} reading questions - user can regenerate later")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error in AI reading generation: {str(e)}")
-                    logger.info(f"⚠️ Skipping {count} {difficulty} reading questions - user can regenerate later")
-        
-        return questions
+Generate exactly {easy + medium + hard} passages total."""
 
     def _batch_generate_reading_questions(self, reading_config: Dict, job_title: str) -> List[Dict]:
         """Generate ALL reading questions in a single API call like aptitude"""
@@ -427,68 +774,45 @@ Return ONLY a JSON array of passages like this:
             return []
         
         # Calculate total questions needed
-        total_questions = reading_config.get('easy', 0) + reading_config.get('medium', 0) + reading_config.get('hard', 0)
+        counts = {difficulty: reading_config.get(difficulty, 0) for difficulty in ('easy', 'medium', 'hard')}
+        total_questions = sum(counts.values())
         if total_questions == 0:
             return []
         
         logger.info(f"🤖 Batch generating {total_questions} reading passages using AI...")
         
         # Create batch prompt for all reading questions
-        prompt = f"""Generate exactly {total_questions} unique reading passages for a {job_title} communication assessment.
-
-BREAKDOWN REQUIRED:
-- {reading_config.get('easy', 0)} EASY passages (simple vocabulary, 3-4 sentences, basic concepts)
-- {reading_config.get('medium', 0)} MEDIUM passages (moderate vocabulary, 4-5 sentences, intermediate concepts)  
-- {reading_config.get('hard', 0)} HARD passages (advanced vocabulary, 5-6 sentences, sophisticated concepts)
-
-Requirements:
-- Each passage should be completely unique and different
-- Content should be relevant to {job_title} work
-- Passages should test pronunciation, fluency, and clarity
-- Use professional, clear language
-- Make each passage engaging and realistic
-
-Return ONLY a JSON array with this exact structure:
-[
-  {{"difficulty": "easy", "passage": "First easy passage about software development..."}},
-  {{"difficulty": "easy", "passage": "Second easy passage with different content..."}},
-  {{"difficulty": "medium", "passage": "First medium passage with moderate complexity..."}},
-  {{"difficulty": "hard", "passage": "First hard passage with advanced concepts..."}}
-]
-
-Generate exactly {total_questions} passages total."""
+        prompt = self._reading_prompt_for(job_title, counts['easy'], counts['medium'], counts['hard'])
 
         try:
-            response = requests.post(
-                f"{self.api_base}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.get_current_api_key()}",
-                    "Content-Type": "application/json"
-                },
-                json={
+            response = self._post_chat_completion(
+                {
                     "model": self.model,
                     "messages": [
-                        {"role": "system", "content": "You are an expert assessment creator. Generate unique, professional reading passages in valid JSON format only."},
+                        _READING_BATCH_SYSTEM_MESSAGE,
                         {"role": "user", "content": prompt}
                     ],
                     "temperature": 0.8,
-                    "max_tokens": 2000
+                    "max_tokens": 2000,
+                    "response_format": {"type": "json_object"}
                 },
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
-                content = result['choices'][0]['message']['content'].strip()
+                result = orjson.loads(response.content)
+                content = result['choices'][0]['message']['content']
                 
-                # Parse the JSON array of passages
-                passages_data = json.loads(content)
+                # Parse the "questions" array of passages
+                passages_data = _extract_questions(content)
+                if not passages_data:
+                    return self._generate_reading_from_templates(reading_config, job_title)
                 
                 questions = []
                 for passage_data in passages_data:
                     difficulty = passage_data['difficulty']
                     passage = passage_data['passage']
-                    time_limit = 120 if difficulty == 'easy' else 180 if difficulty == 'medium' else 240
+                    time_limit = _READING_TIME_LIMITS.get(difficulty, 240)
                     
                     questions.append({
                         'title': f'Reading Assessment - {difficulty.title()} Level',
@@ -498,7 +822,7 @@ Generate exactly {total_questions} passages total."""
                         'type': 'reading_aloud',
                         'difficulty': difficulty,
                         'time_limit': time_limit,
-                        'evaluation_criteria': ['pronunciation', 'fluency', 'pace', 'clarity'],
+                        'evaluation_criteria': _READ_CRITERIA,
                         'instructions': 'Read the paragraph aloud at a natural pace. Focus on clear pronunciation and proper intonation.'
                     })
                 
@@ -514,178 +838,63 @@ Generate exactly {total_questions} passages total."""
             # Fall back to template generation
             return self._generate_reading_from_templates(reading_config, job_title)
 
-    def _generate_reading_from_templates(self, reading_config: Dict, job_title: str) -> List[Dict]:
-        """Generate reading questions using templates when AI fails"""
-        logger.info(f"📝 Using template fallback for reading questions...")
-        
-        easy_count = reading_config.get('easy', 0)
-        medium_count = reading_config.get('medium', 0)
-        hard_count = reading_config.get('hard', 0)
-        
-        reading_templates = {
-            'easy': [
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _reading_templates_for(job_title: str) -> Dict[str, Tuple[str, ...]]:
+        """Reading fallback passages for a job title (cached - they only depend on job_title)"""
+        return {
+            'easy': (
                 f"Software development is a collaborative process that requires clear communication between team members. In {job_title} roles, professionals must effectively convey technical concepts to both technical and non-technical stakeholders.",
                 f"Modern {job_title} work involves continuous learning and adaptation to new technologies. Professionals in this field must stay updated with industry trends and programming languages.",
                 f"Quality assurance and testing are integral parts of the {job_title} workflow. Developers must communicate effectively with QA teams and document bug reports clearly."
-            ],
-            'medium': [
+            ),
+            'medium': (
                 f"Project management in {job_title} roles requires excellent communication skills to coordinate with cross-functional teams. Developers must participate in daily standups, sprint planning meetings, and retrospectives. They need to clearly communicate progress, blockers, and technical challenges to ensure project success.",
                 f"Code review processes in {job_title} positions demand constructive communication and feedback skills. Developers must provide clear, actionable comments on code quality, suggest improvements, and explain best practices to colleagues. This collaborative approach helps maintain code standards."
-            ],
-            'hard': [
-                f"Performance optimization requires {job_title} professionals to analyze system bottlenecks and communicate findings effectively. They must present technical solutions to both technical and business stakeholders, explaining the impact of optimizations on user experience and system reliability while considering trade-offs between performance, maintainability, and development time."
-            ]
+            ),
+            'hard': (
+                f"Performance optimization requires {job_title} professionals to analyze system bottlenecks and communicate findings effectively. They must present technical solutions to both technical and business stakeholders, explaining the impact of optimizations on user experience and system reliability while considering trade-offs between performance, maintainability, and development time.",
+            )
         }
+
+    def _generate_reading_from_templates(self, reading_config: Dict, job_title: str) -> List[Dict]:
+        """Generate reading questions using templates when AI fails"""
+        logger.info(f"📝 Using template fallback for reading questions...")
         
-        questions = []
-        
-        # Generate easy questions
-        for i in range(easy_count):
-            template_index = i % len(reading_templates['easy'])
-            questions.append({
-                'title': f'Reading Assessment - Easy Level {i+1}',
-                'content': 'Please read the following passage aloud clearly and naturally.',
-                'passage': reading_templates['easy'][template_index],
-                'skill': 'reading',
-                'type': 'reading_aloud',
-                'difficulty': 'easy',
-                'time_limit': 120,
-                'evaluation_criteria': ['pronunciation', 'fluency', 'pace', 'clarity'],
-                'instructions': 'Read the paragraph aloud at a natural pace.'
-            })
-        
-        # Generate medium questions
-        for i in range(medium_count):
-            template_index = i % len(reading_templates['medium'])
-            questions.append({
-                'title': f'Reading Assessment - Medium Level {i+1}',
-                'content': 'Please read the following passage aloud clearly and naturally.',
-                'passage': reading_templates['medium'][template_index],
-                'skill': 'reading',
-                'type': 'reading_aloud',
-                'difficulty': 'medium',
-                'time_limit': 180,
-                'evaluation_criteria': ['pronunciation', 'fluency', 'pace', 'clarity'],
-                'instructions': 'Read the paragraph aloud at a natural pace.'
-            })
-        
-        # Generate hard questions
-        for i in range(hard_count):
-            template_index = i % len(reading_templates['hard'])
-            questions.append({
-                'title': f'Reading Assessment - Hard Level {i+1}',
-                'content': 'Please read the following passage aloud clearly and naturally.',
-                'passage': reading_templates['hard'][template_index],
-                'skill': 'reading',
-                'type': 'reading_aloud',
-                'difficulty': 'hard',
-                'time_limit': 240,
-                'evaluation_criteria': ['pronunciation', 'fluency', 'pace', 'clarity'],
-                'instructions': 'Read the paragraph aloud at a natural pace.'
-            })
+        # Shallow copies so callers can't modify the cached dicts (every value is a str, int or tuple)
+        questions = [dict(question) for question in self._reading_template_questions(
+            job_title, reading_config.get('easy', 0), reading_config.get('medium', 0), reading_config.get('hard', 0)
+        )]
         
         logger.info(f"✅ Generated {len(questions)} reading questions using templates")
         return questions
-        return self._ai_generate_listening_questions(listening_config, job_title)
-
-    def _ai_generate_listening_questions(self, listening_config: Dict, job_title: str) -> List[Dict]:
-        """Generate listening questions using AI instead of templates"""
-        questions = []
-        import time
-        
-        # Generate sentence repetition questions
-        sentences_config = listening_config.get('sentences', {})
-        for difficulty in ['easy', 'medium', 'hard']:
-            count = sentences_config.get(difficulty, 0)
-            if count > 0:
-                logger.info(f"🤖 Generating {count} {difficulty} listening sentences using AI...")
-                
-                # Create AI prompt for listening sentences
-                prompt = f"""Generate {count} unique sentences for a {job_title} listening assessment.
-
-Difficulty: {difficulty}
-Requirements:
-- Each sentence should be clear and professional
-- Content should be relevant to {job_title} work
-- Sentences should test listening comprehension and repetition accuracy
-- Make each sentence completely unique and different
-- Use appropriate vocabulary for {difficulty} level
 
-Difficulty Guidelines:
-- Easy: Simple vocabulary, short sentences (8-12 words), basic concepts
-- Medium: Moderate vocabulary, medium sentences (12-16 words), intermediate concepts  
-- Hard: Advanced vocabulary, complex sentences (16-20 words), sophisticated concepts
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _reading_template_questions(job_title: str, easy_count: int, medium_count: int, hard_count: int) -> Tuple[Dict, ...]:
+        """Reading template questions (cached - the output only depends on the job title and counts)"""
+        reading_templates = GroqQuestionGenerator._reading_templates_for(job_title)
+        
+        # Invariant fields come from per-difficulty prototypes; only the title number and passage vary
+        return tuple(
+            {**_READING_TEMPLATE_PROTOTYPES[difficulty], 'title': title_prefix + str(i), 'passage': passage}
+            for difficulty, count in (('easy', easy_count), ('medium', medium_count), ('hard', hard_count))
+            for title_prefix in (f'Reading Assessment - {difficulty.title()} Level ',)
+            for i, passage in enumerate(islice(cycle(reading_templates[difficulty]), count), 1)
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _listening_prompt_for(job_title: str, easy: int, medium: int, hard: int) -> str:
+        """Batch listening prompt (cached - identical configs reuse the same text)"""
+        return f"""Generate exactly {easy + medium + hard} unique sentences for a {job_title} listening assessment.
 
-Return ONLY a JSON array of sentences like this:
-[
-  "First unique sentence about {job_title} work.",
-  "Second completely different sentence.",
-  "Third unique sentence with different content."
-]"""
+BREAKDOWN REQUIRED:
+- {easy} EASY sentences
+- {medium} MEDIUM sentences
+- {hard} HARD sentences
 
-                try:
-                    response = requests.post(
-                        f"{self.api_base}/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {self.get_current_api_key()}",
-                            "Content-Type": "application/json"
-                        },
-                        json={
-                            "model": self.model,
-                            "messages": [
-                                {"role": "system", "content": "You are an expert assessment creator. Generate unique, professional listening sentences. Return only valid JSON."},
-                                {"role": "user", "content": prompt}
-                            ],
-                            "temperature": 0.8,  # Higher creativity for unique content
-                            "max_tokens": 500
-                        },
-                        timeout=30
-                    )
-                    
-                    if response.status_code == 200:
-                        result = response.json()
-                        content = result['choices'][0]['message']['content'].strip()
-                        
-                        # Parse the JSON array of sentences
-                        sentences = json.loads(content)
-                        
-                        # Validate exact count - trim if too many, warn if too few
-                        if len(sentences) > count:
-                            logger.warning(f"⚠️ AI generated {len(sentences)} {difficulty} listening sentences, expected {count}. Trimming to exact count.")
-                            sentences = sentences[:count]
-                        elif len(sentences) < count:
-                            logger.warning(f"⚠️ AI generated {len(sentences)} {difficulty} listening sentences, expected {count}. Using what was generated.")
-                        
-                        # Convert to question format
-                        for i, sentence in enumerate(sentences):
-                            time_limit = 60 if difficulty == 'easy' else 90 if difficulty == 'medium' else 120
-                            
-                            questions.append({
-                                'title': f'Sentence Repetition - {difficulty.title()} Level',
-                                'content': 'Listen to the sentence and repeat it exactly as you heard it.',
-                                'audio_text': sentence,
-                                'skill': 'listening',
-                                'subtype': 'sentence',
-                                'type': 'listening',
-                                'difficulty': difficulty,
-                                'time_limit': time_limit,
-                                'evaluation_criteria': ['accuracy', 'pronunciation', 'fluency'],
-                                'instructions': 'Listen carefully to the sentence, then repeat it exactly as you heard it.'
-                            })
-                        
-                        logger.info(f"✅ AI generated {len(sentences)} unique {difficulty} listening sentences (requested: {count})")
-                        
-                        # Add delay to avoid rate limits
-                        time.sleep(0.5)
-                    else:
-                        logger.error(f"❌ AI generation failed for {difficulty} listening: {response.status_code}")
-                        logger.info(f"⚠️ Skipping {count} {difficulty} listening questions - user can regenerate later")
-                        
-                except Exception as e:
-                    logger.error(f"❌ Error in AI listening generation: {str(e)}")
-                    logger.info(f"⚠️ Skipping {count} {difficulty} listening questions - user can regenerate later")
-        
-        return questions
+Generate exactly {easy + medium + hard} sentences total."""
 
     def _batch_generate_listening_questions(self, listening_config: Dict, job_title: str) -> List[Dict]:
         """Generate ALL listening questions in a single API call like aptitude"""
@@ -695,68 +904,45 @@ Return ONLY a JSON array of sentences like this:
         
         # Calculate total questions needed
         sentences_config = listening_config.get('sentences', {})
-        total_questions = sentences_config.get('easy', 0) + sentences_config.get('medium', 0) + sentences_config.get('hard', 0)
+        counts = {difficulty: sentences_config.get(difficulty, 0) for difficulty in ('easy', 'medium', 'hard')}
+        total_questions = sum(counts.values())
         if total_questions == 0:
             return []
         
         logger.info(f"🤖 Batch generating {total_questions} listening sentences using AI...")
         
         # Create batch prompt for all listening questions
-        prompt = f"""Generate exactly {total_questions} unique sentences for a {job_title} listening assessment.
-
-BREAKDOWN REQUIRED:
-- {sentences_config.get('easy', 0)} EASY sentences (8-12 words, simple vocabulary, basic concepts)
-- {sentences_config.get('medium', 0)} MEDIUM sentences (12-16 words, moderate vocabulary, intermediate concepts)
-- {sentences_config.get('hard', 0)} HARD sentences (16-20 words, advanced vocabulary, sophisticated concepts)
-
-Requirements:
-- Each sentence should be completely unique and different
-- Content should be relevant to {job_title} work
-- Sentences should test listening comprehension and repetition accuracy
-- Use professional, clear language
-- Make each sentence realistic and engaging
-
-Return ONLY a JSON array with this exact structure:
-[
-  {{"difficulty": "easy", "sentence": "First easy sentence about software development."}},
-  {{"difficulty": "easy", "sentence": "Second easy sentence with different content."}},
-  {{"difficulty": "medium", "sentence": "First medium sentence with moderate complexity and length."}},
-  {{"difficulty": "hard", "sentence": "First hard sentence with advanced concepts and sophisticated vocabulary structure."}}
-]
-
-Generate exactly {total_questions} sentences total."""
+        prompt = self._listening_prompt_for(job_title, counts['easy'], counts['medium'], counts['hard'])
 
         try:
-            response = requests.post(
-                f"{self.api_base}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.get_current_api_key()}",
-                    "Content-Type": "application/json"
-                },
-                json={
+            response = self._post_chat_completion(
+                {
                     "model": self.model,
                     "messages": [
-                        {"role": "system", "content": "You are an expert assessment creator. Generate unique, professional listening sentences in valid JSON format only."},
+                        _LISTENING_BATCH_SYSTEM_MESSAGE,
                         {"role": "user", "content": prompt}
                     ],
                     "temperature": 0.8,
-                    "max_tokens": 1500
+                    "max_tokens": _completion_budget(total_questions, 60, 200),
+                    "response_format": {"type": "json_object"}
                 },
                 timeout=30
             )
             
             if response.status_code == 200:
-                result = response.json()
-                content = result['choices'][0]['message']['content'].strip()
+                result = orjson.loads(response.content)
+                content = result['choices'][0]['message']['content']
                 
-                # Parse the JSON array of sentences
-                sentences_data = json.loads(content)
+                # Parse the "questions" array of sentences
+                sentences_data = _extract_questions(content)
+                if not sentences_data:
+                    return self._generate_listening_from_templates(listening_config, job_title)
                 
                 questions = []
                 for sentence_data in sentences_data:
                     difficulty = sentence_data['difficulty']
                     sentence = sentence_data['sentence']
-                    time_limit = 60 if difficulty == 'easy' else 90 if difficulty == 'medium' else 120
+                    time_limit = _TIME_LIMITS.get(difficulty, 120)
                     
                     questions.append({
                         'title': f'Sentence Repetition - {difficulty.title()} Level',
@@ -767,7 +953,7 @@ Generate exactly {total_questions} sentences total."""
                         'type': 'listening',
                         'difficulty': difficulty,
                         'time_limit': time_limit,
-                        'evaluation_criteria': ['accuracy', 'pronunciation', 'fluency'],
+                        'evaluation_criteria': _LISTEN_CRITERIA,
                         'instructions': 'Listen carefully to the sentence, then repeat it exactly as you heard it.'
                     })
                 
@@ -788,10 +974,18 @@ Generate exactly {total_questions} sentences total."""
         logger.info(f"📝 Using template fallback for listening questions...")
         
         sentences_config = listening_config.get('sentences', {})
-        easy_count = sentences_config.get('easy', 0)
-        medium_count = sentences_config.get('medium', 0)
-        hard_count = sentences_config.get('hard', 0)
+        # Shallow copies so callers can't modify the cached dicts (every value is a str, int or tuple)
+        questions = [dict(question) for question in self._listening_template_questions(
+            job_title, sentences_config.get('easy', 0), sentences_config.get('medium', 0), sentences_config.get('hard', 0)
+        )]
         
+        logger.info(f"✅ Generated {len(questions)} listening questions using templates")
+        return questions
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _listening_template_questions(job_title: str, easy_count: int, medium_count: int, hard_count: int) -> Tuple[Dict, ...]:
+        """Listening template questions (cached - the output only depends on the job title and counts)"""
         listening_templates = {
             'easy': [
                 f"Effective {job_title} professionals collaborate with teams.",
@@ -808,205 +1002,24 @@ Generate exactly {total_questions} sentences total."""
             ]
         }
         
-        questions = []
-        
-        # Generate easy questions
-        for i in range(easy_count):
-            template_index = i % len(listening_templates['easy'])
-            questions.append({
-                'title': f'Sentence Repetition - Easy Level {i+1}',
-                'content': 'Listen to the sentence and repeat it exactly as you heard it.',
-                'audio_text': listening_templates['easy'][template_index],
-                'skill': 'listening',
-                'subtype': 'sentence',
-                'type': 'listening',
-                'difficulty': 'easy',
-                'time_limit': 60,
-                'evaluation_criteria': ['accuracy', 'pronunciation', 'fluency'],
-                'instructions': 'Listen carefully, then repeat exactly as you heard it.'
-            })
-        
-        # Generate medium questions
-        for i in range(medium_count):
-            template_index = i % len(listening_templates['medium'])
-            questions.append({
-                'title': f'Sentence Repetition - Medium Level {i+1}',
-                'content': 'Listen to the sentence and repeat it exactly as you heard it.',
-                'audio_text': listening_templates['medium'][template_index],
-                'skill': 'listening',
-                'subtype': 'sentence',
-                'type': 'listening',
-                'difficulty': 'medium',
-                'time_limit': 90,
-                'evaluation_criteria': ['accuracy', 'pronunciation', 'fluency'],
-                'instructions': 'Listen carefully, then repeat exactly as you heard it.'
-            })
-        
-        # Generate hard questions
-        for i in range(hard_count):
-            template_index = i % len(listening_templates['hard'])
-            questions.append({
-                'title': f'Sentence Repetition - Hard Level {i+1}',
-                'content': 'Listen to the sentence and repeat it exactly as you heard it.',
-                'audio_text': listening_templates['hard'][template_index],
-                'skill': 'listening',
-                'subtype': 'sentence',
-                'type': 'listening',
-                'difficulty': 'hard',
-                'time_limit': 120,
-                'evaluation_criteria': ['accuracy', 'pronunciation', 'fluency'],
-                'instructions': 'Listen carefully, then repeat exactly as you heard it.'
-            })
-        
-        logger.info(f"✅ Generated {len(questions)} listening questions using templates")
-        return questions
-
-    def _generate_grammar_questions(self, grammar_config: Dict, job_title: str) -> List[Dict]:
-        """Generate grammar assessment questions using AI ONLY - no fallback templates"""
-        
-        topics = grammar_config.get('topics', [])
-        topic_questions = grammar_config.get('topicQuestions', {})
-        
-        logger.info(f"🔍 Grammar config received: {grammar_config}")
-        logger.info(f"📝 Topics: {topics}")
-        logger.info(f"📊 Topic questions: {topic_questions}")
-        
-        if not self.api_keys:
-            logger.error("❌ No GROQ API key - cannot generate AI grammar questions")
-            return [{
-                'title': 'AI Generation Error',
-                'content': 'AI service unavailable - no GROQ API key configured',
-                'options': {'A': 'ERROR', 'B': 'AI not', 'C': 'able to', 'D': 'generate content'},
-                'correct_answer': 'A',
-                'skill': 'grammar',
-                'type': 'error',
-                'difficulty': 'error',
-                'time_limit': 60,
-                'error': True
-            }]
-        
-        if not topics:
-            logger.error("❌ No grammar topics specified - cannot generate questions")
-            return [{
-                'title': 'Configuration Error',
-                'content': 'No grammar topics specified for assessment',
-                'options': {'A': 'ERROR', 'B': 'No topics', 'C': 'specified', 'D': 'for assessment'},
-                'correct_answer': 'A',
-                'skill': 'grammar',
-                'type': 'error',
-                'difficulty': 'error',
-                'time_limit': 60,
-                'error': True
-            }]
-        
-        # Use ONLY AI generation - no templates
-        return self._ai_generate_grammar_questions(topics, topic_questions, job_title)
+        # Invariant fields come from per-difficulty prototypes; only the title number and sentence vary
+        return tuple(
+            {**_LISTENING_TEMPLATE_PROTOTYPES[difficulty], 'title': title_prefix + str(i), 'audio_text': sentence}
+            for difficulty, count in (('easy', easy_count), ('medium', medium_count), ('hard', hard_count))
+            for title_prefix in (f'Sentence Repetition - {difficulty.title()} Level ',)
+            for i, sentence in enumerate(islice(cycle(listening_templates[difficulty]), count), 1)
+        )
 
-    def _ai_generate_grammar_questions(self, topics: List[str], topic_questions: Dict, job_title: str) -> List[Dict]:
-        """Generate grammar questions using AI instead of templates"""
-        questions = []
-        import time
-        
-        for topic in topics:
-            topic_config = topic_questions.get(topic, {})
-            
-            for difficulty in ['easy', 'medium', 'hard']:
-                count = topic_config.get(difficulty, 0)
-                if count > 0:
-                    logger.info(f"🤖 Generating {count} {difficulty} {topic} grammar questions using AI...")
-                    
-                    # Create AI prompt for grammar questions
-                    prompt = f"""Generate {count} unique multiple choice grammar questions about {topic} for a {job_title} assessment.
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _grammar_prompt_for(job_title: str, topic_breakdown: Tuple[str, ...], total_questions: int) -> str:
+        """Batch grammar prompt (cached - identical configs reuse the same text)"""
+        return f"""Generate exactly {total_questions} unique multiple choice grammar questions for a {job_title} assessment.
 
-Topic: {topic}
-Difficulty: {difficulty}
-Requirements:
-- Each question should test {topic} knowledge
-- Questions should be relevant to {job_title} work context
-- Provide 4 options (A, B, C, D) for each question
-- Make each question completely unique and different
-- Use professional language appropriate for {difficulty} level
+BREAKDOWN REQUIRED:
+{chr(10).join(topic_breakdown)}
 
-Difficulty Guidelines:
-- Easy: Basic {topic} rules, simple examples
-- Medium: Intermediate {topic} usage, moderate complexity
-- Hard: Advanced {topic} concepts, complex scenarios
-
-Return ONLY a JSON array of questions like this:
-[
-  {{
-    "question": "Choose the correct {topic}: 'The developer ____ working on the project.'",
-    "options": {{"A": "is", "B": "are", "C": "was", "D": "were"}},
-    "correct_answer": "A",
-    "explanation": "Brief explanation of why A is correct"
-  }}
-]"""
-
-                    try:
-                        response = requests.post(
-                            f"{self.api_base}/chat/completions",
-                            headers={
-                                "Authorization": f"Bearer {self.get_current_api_key()}",
-                                "Content-Type": "application/json"
-                            },
-                            json={
-                                "model": self.model,
-                                "messages": [
-                                    {"role": "system", "content": "You are an expert grammar assessment creator. Generate unique, professional grammar questions. Return only valid JSON."},
-                                    {"role": "user", "content": prompt}
-                                ],
-                                "temperature": 0.7,  # Balanced creativity for grammar
-                                "max_tokens": 1000
-                            },
-                            timeout=30
-                        )
-                        
-                        if response.status_code == 200:
-                            result = response.json()
-                            content = result['choices'][0]['message']['content'].strip()
-                            
-                            # Parse the JSON array of questions
-                            ai_questions = json.loads(content)
-                            
-                            # Validate exact count - trim if too many, warn if too few
-                            if len(ai_questions) > count:
-                                logger.warning(f"⚠️ AI generated {len(ai_questions)} {difficulty} {topic} questions, expected {count}. Trimming to exact count.")
-                                ai_questions = ai_questions[:count]
-                            elif len(ai_questions) < count:
-                                logger.warning(f"⚠️ AI generated {len(ai_questions)} {difficulty} {topic} questions, expected {count}. Using what was generated.")
-                            
-                            # Convert to question format
-                            for i, q in enumerate(ai_questions):
-                                time_limit = 90
-                                
-                                questions.append({
-                                    'title': f'Grammar: {topic.title()} - {difficulty.title()}',
-                                    'content': q['question'],
-                                    'options': q['options'],
-                                    'correct_answer': q['correct_answer'],
-                                    'explanation': q.get('explanation', ''),
-                                    'skill': 'grammar',
-                                    'type': 'grammar',
-                                    'topic': topic,
-                                    'difficulty': difficulty,
-                                    'time_limit': time_limit,
-                                    'evaluation_criteria': ['grammatical_accuracy', 'language_knowledge'],
-                                    'instructions': 'Select the most grammatically correct option.'
-                                })
-                            
-                            logger.info(f"✅ AI generated {len(ai_questions)} unique {difficulty} {topic} questions (requested: {count})")
-                            
-                            # Add delay to avoid rate limits
-                            time.sleep(0.5)
-                        else:
-                            logger.error(f"❌ AI generation failed for {difficulty} {topic}: {response.status_code}")
-                            logger.info(f"⚠️ Skipping {count} {difficulty} {topic} questions - user can regenerate later")
-                            
-                    except Exception as e:
-                        logger.error(f"❌ Error in AI grammar generation: {str(e)}")
-                        logger.info(f"⚠️ Skipping {count} {difficulty} {topic} questions - user can regenerate later")
-        
-        return questions
+Generate exactly {total_questions} questions total covering all specified topics and difficulties."""
 
     def _batch_generate_grammar_questions(self, grammar_config: Dict, job_title: str) -> List[Dict]:
         """Generate ALL grammar questions in a single API call like aptitude"""
@@ -1021,93 +1034,55 @@ Return ONLY a JSON array of questions like this:
             logger.error("❌ No grammar topics specified")
             return []
         
-        # Calculate total questions needed
-        total_questions = 0
-        topic_breakdown = []
-        for topic in topics:
-            topic_config = topic_questions.get(topic, {})
-            easy_count = topic_config.get('easy', 0)
-            medium_count = topic_config.get('medium', 0)
-            hard_count = topic_config.get('hard', 0)
-            topic_total = easy_count + medium_count + hard_count
-            
-            if topic_total > 0:
-                total_questions += topic_total
-                topic_breakdown.append(f"- {topic.upper()}: {easy_count} easy, {medium_count} medium, {hard_count} hard (Total: {topic_total})")
-        
+        # Calculate total questions needed before building anything else
+        topic_counts = {
+            topic: {difficulty: topic_questions.get(topic, {}).get(difficulty, 0) for difficulty in ('easy', 'medium', 'hard')}
+            for topic in topics
+        }
+        total_questions = sum(sum(counts.values()) for counts in topic_counts.values())
         if total_questions == 0:
             return []
         
+        topic_breakdown = [
+            f"- {topic.upper()}: {counts['easy']} easy, {counts['medium']} medium, {counts['hard']} hard (Total: {sum(counts.values())})"
+            for topic, counts in topic_counts.items()
+            if sum(counts.values()) > 0
+        ]
+        
         logger.info(f"🤖 Batch generating {total_questions} grammar questions using AI...")
         
         # Create batch prompt for all grammar questions
-        prompt = f"""Generate exactly {total_questions} unique multiple choice grammar questions for a {job_title} assessment.
-
-BREAKDOWN REQUIRED:
-{chr(10).join(topic_breakdown)}
-
-Requirements:
-- Each question should test the specified grammar topic
-- Questions should be relevant to {job_title} work context
-- Provide 4 options (A, B, C, D) for each question
-- Make each question completely unique and different
-- Use professional language appropriate for difficulty level
-
-Difficulty Guidelines:
-- Easy: Basic grammar rules, simple examples
-- Medium: Intermediate grammar usage, moderate complexity
-- Hard: Advanced grammar concepts, complex scenarios
-
-Return ONLY a JSON array with this exact structure:
-[
-  {{
-    "topic": "tenses",
-    "difficulty": "easy", 
-    "question": "Which sentence uses the correct present perfect tense?",
-    "options": {{
-      "A": "I have completed the project yesterday.",
-      "B": "I completed the project yesterday.", 
-      "C": "I have completed the project.",
-      "D": "I am completing the project yesterday."
-    }},
-    "correct_answer": "C",
-    "explanation": "Present perfect tense is used for actions completed at an unspecified time."
-  }}
-]
-
-Generate exactly {total_questions} questions total covering all specified topics and difficulties."""
+        prompt = self._grammar_prompt_for(job_title, tuple(topic_breakdown), total_questions)
 
         try:
-            response = requests.post(
-                f"{self.api_base}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.get_current_api_key()}",
-                    "Content-Type": "application/json"
-                },
-                json={
+            response = self._post_chat_completion(
+                {
                     "model": self.model,
                     "messages": [
-                        {"role": "system", "content": "You are an expert grammar assessment creator. Generate unique, professional grammar questions in valid JSON format only."},
+                        _GRAMMAR_BATCH_SYSTEM_MESSAGE,
                         {"role": "user", "content": prompt}
                     ],
                     "temperature": 0.7,
-                    "max_tokens": 3000
+                    "max_tokens": _completion_budget(total_questions, 180, 300),
+                    "response_format": {"type": "json_object"}
                 },
                 timeout=45
             )
             
             if response.status_code == 200:
-                result = response.json()
-                content = result['choices'][0]['message']['content'].strip()
+                result = orjson.loads(response.content)
+                content = result['choices'][0]['message']['content']
                 
-                # Parse the JSON array of questions
-                questions_data = json.loads(content)
+                # Parse the "questions" array
+                questions_data = _extract_questions(content)
+                if not questions_data:
+                    return self._generate_grammar_from_templates(grammar_config, job_title)
                 
                 questions = []
                 for q_data in questions_data:
                     topic = q_data['topic']
                     difficulty = q_data['difficulty']
-                    time_limit = 60 if difficulty == 'easy' else 90 if difficulty == 'medium' else 120
+                    time_limit = _TIME_LIMITS.get(difficulty, 120)
                     
                     questions.append({
                         'title': f'Grammar Assessment - {difficulty.title()} {topic.title()}',
@@ -1120,7 +1095,7 @@ Generate exactly {total_questions} questions total covering all specified topics
                         'topic': topic,
                         'difficulty': difficulty,
                         'time_limit': time_limit,
-                        'evaluation_criteria': ['grammatical_accuracy', 'language_knowledge'],
+                        'evaluation_criteria': _GRAMMAR_CRITERIA,
                         'instructions': 'Select the most grammatically correct option.'
                     })
                 
@@ -1140,205 +1115,44 @@ Generate exactly {total_questions} questions total covering all specified topics
         """Generate grammar questions using templates when AI fails"""
         logger.info(f"📝 Using template fallback for grammar questions...")
         
-        topics = grammar_config.get('topics', [])
         topic_questions = grammar_config.get('topicQuestions', {})
-        
-        grammar_templates = {
-            'tenses': {
-                'easy': [
-                    {"question": "Which sentence uses the correct present tense?", "options": {"A": "I work as a developer.", "B": "I working as a developer.", "C": "I am work as a developer.", "D": "I works as a developer."}, "correct_answer": "A"},
-                    {"question": "Select the correct present tense form:", "options": {"A": "She codes every day.", "B": "She coding every day.", "C": "She is code every day.", "D": "She code every day."}, "correct_answer": "A"},
-                    {"question": "Which sentence is in the correct present tense?", "options": {"A": "They tests the software.", "B": "They test the software.", "C": "They testing the software.", "D": "They are test the software."}, "correct_answer": "B"},
-                    {"question": "Choose the correct present tense:", "options": {"A": "He debug the code.", "B": "He debugs the code.", "C": "He debugging the code.", "D": "He is debug the code."}, "correct_answer": "B"},
-                    {"question": "Which is the correct present tense?", "options": {"A": "We writes clean code.", "B": "We writing clean code.", "C": "We write clean code.", "D": "We are write clean code."}, "correct_answer": "C"},
-                    {"question": "Select the proper present tense:", "options": {"A": "The team meets every Monday.", "B": "The team meeting every Monday.", "C": "The team meet every Monday.", "D": "The team is meet every Monday."}, "correct_answer": "A"},
-                    {"question": "Which sentence shows correct present tense?", "options": {"A": "She tests the application.", "B": "She testing the application.", "C": "She test the application.", "D": "She is test the application."}, "correct_answer": "A"},
-                    {"question": "Choose the right present tense form:", "options": {"A": "It works perfectly.", "B": "It working perfectly.", "C": "It work perfectly.", "D": "It is work perfectly."}, "correct_answer": "A"},
-                    {"question": "Which uses correct present tense?", "options": {"A": "They develops software.", "B": "They developing software.", "C": "They develop software.", "D": "They are develop software."}, "correct_answer": "C"},
-                    {"question": "Select correct present tense:", "options": {"A": "The code runs smoothly.", "B": "The code running smoothly.", "C": "The code run smoothly.", "D": "The code is run smoothly."}, "correct_answer": "A"},
-                    {"question": "Which is in present tense?", "options": {"A": "I creates websites.", "B": "I creating websites.", "C": "I create websites.", "D": "I am create websites."}, "correct_answer": "C"},
-                    {"question": "Choose present tense form:", "options": {"A": "She learns new technologies.", "B": "She learning new technologies.", "C": "She learn new technologies.", "D": "She is learn new technologies."}, "correct_answer": "A"},
-                    {"question": "Which shows present tense?", "options": {"A": "We uses Git for version control.", "B": "We using Git for version control.", "C": "We use Git for version control.", "D": "We are use Git for version control."}, "correct_answer": "C"},
-                    {"question": "Select the present tense:", "options": {"A": "The system processes data.", "B": "The system processing data.", "C": "The system process data.", "D": "The system is process data."}, "correct_answer": "A"},
-                    {"question": "Which is correct present tense?", "options": {"A": "He fixes bugs quickly.", "B": "He fixing bugs quickly.", "C": "He fix bugs quickly.", "D": "He is fix bugs quickly."}, "correct_answer": "A"}
-                ],
-                'medium': [
-                    {"question": "Which sentence uses the correct present perfect tense?", "options": {"A": "I have completed the project yesterday.", "B": "I completed the project yesterday.", "C": "I have completed the project.", "D": "I am completing the project yesterday."}, "correct_answer": "C"},
-                    {"question": "Select the correct present continuous tense:", "options": {"A": "We working on the new feature.", "B": "We are working on the new feature.", "C": "We have working on the new feature.", "D": "We work on the new feature now."}, "correct_answer": "B"},
-                    {"question": "Choose the right present perfect:", "options": {"A": "She has written the documentation.", "B": "She has wrote the documentation.", "C": "She have written the documentation.", "D": "She is written the documentation."}, "correct_answer": "A"},
-                    {"question": "Which uses present continuous correctly?", "options": {"A": "They developing the app.", "B": "They are developing the app.", "C": "They have developing the app.", "D": "They develops the app."}, "correct_answer": "B"},
-                    {"question": "Select correct present perfect:", "options": {"A": "We have finish the sprint.", "B": "We have finished the sprint.", "C": "We has finished the sprint.", "D": "We are finished the sprint."}, "correct_answer": "B"},
-                    {"question": "Which shows present continuous?", "options": {"A": "He debugging the issue.", "B": "He is debugging the issue.", "C": "He have debugging the issue.", "D": "He debugs the issue."}, "correct_answer": "B"},
-                    {"question": "Choose present perfect form:", "options": {"A": "The team has deployed the code.", "B": "The team have deployed the code.", "C": "The team has deploy the code.", "D": "The team is deployed the code."}, "correct_answer": "A"},
-                    {"question": "Which is present continuous?", "options": {"A": "I testing the feature.", "B": "I am testing the feature.", "C": "I have testing the feature.", "D": "I tests the feature."}, "correct_answer": "B"},
-                    {"question": "Select present perfect tense:", "options": {"A": "She has learn React.", "B": "She has learned React.", "C": "She have learned React.", "D": "She is learned React."}, "correct_answer": "B"},
-                    {"question": "Which uses present continuous?", "options": {"A": "We reviewing the code.", "B": "We are reviewing the code.", "C": "We have reviewing the code.", "D": "We reviews the code."}, "correct_answer": "B"},
-                    {"question": "Choose correct present perfect:", "options": {"A": "They has completed the task.", "B": "They have completed the task.", "C": "They have complete the task.", "D": "They are completed the task."}, "correct_answer": "B"},
-                    {"question": "Which is present continuous tense?", "options": {"A": "The server running smoothly.", "B": "The server is running smoothly.", "C": "The server have running smoothly.", "D": "The server runs smoothly."}, "correct_answer": "B"},
-                    {"question": "Select present perfect form:", "options": {"A": "I has fixed the bug.", "B": "I have fixed the bug.", "C": "I have fix the bug.", "D": "I am fixed the bug."}, "correct_answer": "B"},
-                    {"question": "Which shows present continuous?", "options": {"A": "She implementing the feature.", "B": "She is implementing the feature.", "C": "She have implementing the feature.", "D": "She implements the feature."}, "correct_answer": "B"},
-                    {"question": "Choose present perfect tense:", "options": {"A": "We has updated the database.", "B": "We have updated the database.", "C": "We have update the database.", "D": "We are updated the database."}, "correct_answer": "B"}
-                ],
-                'hard': [
-                    {"question": "Which sentence uses the past perfect tense correctly?", "options": {"A": "I had finished the code before the meeting started.", "B": "I have finished the code before the meeting started.", "C": "I finished the code before the meeting started.", "D": "I was finishing the code before the meeting started."}, "correct_answer": "A"},
-                    {"question": "Select the correct past perfect continuous:", "options": {"A": "She had been working on the project for months.", "B": "She has been working on the project for months.", "C": "She was working on the project for months.", "D": "She is working on the project for months."}, "correct_answer": "A"},
-                    {"question": "Which uses future perfect correctly?", "options": {"A": "By next week, we will finished the development.", "B": "By next week, we will have finished the development.", "C": "By next week, we will finish the development.", "D": "By next week, we are finishing the development."}, "correct_answer": "B"},
-                    {"question": "Choose the right past perfect:", "options": {"A": "They had deploy the application before the deadline.", "B": "They had deployed the application before the deadline.", "C": "They have deployed the application before the deadline.", "D": "They were deploying the application before the deadline."}, "correct_answer": "B"},
-                    {"question": "Which shows future perfect tense?", "options": {"A": "I will complete the task by tomorrow.", "B": "I will have complete the task by tomorrow.", "C": "I will have completed the task by tomorrow.", "D": "I am completing the task by tomorrow."}, "correct_answer": "C"},
-                    {"question": "Select past perfect continuous:", "options": {"A": "He had been debugging for hours.", "B": "He has been debugging for hours.", "C": "He was debugging for hours.", "D": "He is debugging for hours."}, "correct_answer": "A"},
-                    {"question": "Which uses conditional perfect?", "options": {"A": "If I had known, I would fix the bug.", "B": "If I had known, I would have fixed the bug.", "C": "If I know, I would have fixed the bug.", "D": "If I knew, I will fix the bug."}, "correct_answer": "B"},
-                    {"question": "Choose future perfect form:", "options": {"A": "She will has learned Python by December.", "B": "She will have learn Python by December.", "C": "She will have learned Python by December.", "D": "She will learning Python by December."}, "correct_answer": "C"},
-                    {"question": "Which is past perfect tense?", "options": {"A": "The team had tested the application thoroughly.", "B": "The team has tested the application thoroughly.", "C": "The team tested the application thoroughly.", "D": "The team was testing the application thoroughly."}, "correct_answer": "A"},
-                    {"question": "Select correct conditional perfect:", "options": {"A": "We would completed the project if we had more time.", "B": "We would have completed the project if we had more time.", "C": "We would complete the project if we had more time.", "D": "We will complete the project if we have more time."}, "correct_answer": "B"},
-                    {"question": "Which shows past perfect continuous?", "options": {"A": "I had been coding all night.", "B": "I have been coding all night.", "C": "I was coding all night.", "D": "I am coding all night."}, "correct_answer": "A"},
-                    {"question": "Choose future perfect tense:", "options": {"A": "By 2025, AI will revolutionize software development.", "B": "By 2025, AI will have revolutionize software development.", "C": "By 2025, AI will have revolutionized software development.", "D": "By 2025, AI is revolutionizing software development."}, "correct_answer": "C"},
-                    {"question": "Which uses past perfect correctly?", "options": {"A": "She had wrote the code before the review.", "B": "She had written the code before the review.", "C": "She has written the code before the review.", "D": "She wrote the code before the review."}, "correct_answer": "B"},
-                    {"question": "Select past perfect continuous form:", "options": {"A": "They had been working remotely since March.", "B": "They have been working remotely since March.", "C": "They were working remotely since March.", "D": "They are working remotely since March."}, "correct_answer": "A"},
-                    {"question": "Which is future perfect tense?", "options": {"A": "The system will process all data by midnight.", "B": "The system will have process all data by midnight.", "C": "The system will have processed all data by midnight.", "D": "The system is processing all data by midnight."}, "correct_answer": "C"}
-                ]
-            },
-            'articles': {
-                'easy': [
-                    {"question": "Choose the correct article: 'She is ___ developer.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article needed"}, "correct_answer": "A"},
-                    {"question": "Select the right article: 'He works as ___ engineer.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "B"},
-                    {"question": "Which article fits: 'I need ___ computer for work.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "A"},
-                    {"question": "Choose the article: 'We hired ___ new programmer.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "A"},
-                    {"question": "Select correct article: 'She bought ___ iPhone.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "B"},
-                    {"question": "Which article: 'He is ___ software architect.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "A"},
-                    {"question": "Choose article: 'I work at ___ startup company.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "A"},
-                    {"question": "Select article: 'She uses ___ Android phone.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "B"},
-                    {"question": "Which fits: 'We need ___ database administrator.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "A"},
-                    {"question": "Choose: 'He is ___ UI/UX designer.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "A"},
-                    {"question": "Select: 'I bought ___ laptop yesterday.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "A"},
-                    {"question": "Which: 'She is ___ excellent coder.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "B"},
-                    {"question": "Choose: 'We use ___ agile methodology.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "B"},
-                    {"question": "Select: 'He drives ___ electric car.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "B"},
-                    {"question": "Which: 'I am ___ full-stack developer.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "A"}
-                ],
-                'medium': [
-                    {"question": "Select the correct article usage: 'We need ___ experienced programmer.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "B"},
-                    {"question": "Choose the appropriate article: 'This is ___ best solution.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "C"},
-                    {"question": "Which article: '___ Internet has changed everything.'", "options": {"A": "A", "B": "An", "C": "The", "D": "No article"}, "correct_answer": "C"},
-                    {"question": "Select article: 'She is ___ most skilled developer.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "C"},
-                    {"question": "Choose: 'We work in ___ same building.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "C"},
-                    {"question": "Which: 'He is ___ only one who knows Python.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "C"},
-                    {"question": "Select: '___ first version was released yesterday.'", "options": {"A": "A", "B": "An", "C": "The", "D": "No article"}, "correct_answer": "C"},
-                    {"question": "Choose: 'She works for ___ largest tech company.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "C"},
-                    {"question": "Which: 'We use ___ latest technology.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "C"},
-                    {"question": "Select: 'He is ___ second person to join.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "C"},
-                    {"question": "Choose: '___ next meeting is on Monday.'", "options": {"A": "A", "B": "An", "C": "The", "D": "No article"}, "correct_answer": "C"},
-                    {"question": "Which: 'She has ___ unique approach to coding.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "A"},
-                    {"question": "Select: 'We found ___ perfect candidate.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "C"},
-                    {"question": "Choose: 'He works at ___ top-rated company.'", "options": {"A": "a", "B": "an", "C": "the", "D": "no article"}, "correct_answer": "A"},
-                    {"question": "Which: '___ final decision will be made tomorrow.'", "options": {"A": "A", "B": "An", "C": "The", "D": "No article"}, "correct_answer": "C"}
-                ],
-                'hard': [
-                    {"question": "Choose the appropriate article: '___ software industry requires constant learning.'", "options": {"A": "A", "B": "An", "C": "The", "D": "No article"}, "correct_answer": "C"},
-                    {"question": "Select article: '___ artificial intelligence will transform ___ future.'", "options": {"A": "The, the", "B": "An, the", "C": "A, the", "D": "No article, the"}, "correct_answer": "A"},
-                    {"question": "Which: 'She has ___ PhD in ___ computer science.'", "options": {"A": "a, the", "B": "a, no article", "C": "the, the", "D": "an, no article"}, "correct_answer": "B"},
-                    {"question": "Choose: '___ machine learning is ___ subset of AI.'", "options": {"A": "The, a", "B": "A, a", "C": "No article, a", "D": "The, the"}, "correct_answer": "C"},
-                    {"question": "Select: 'He works in ___ field of ___ cybersecurity.'", "options": {"A": "a, the", "B": "the, no article", "C": "a, no article", "D": "the, the"}, "correct_answer": "B"},
-                    {"question": "Which: '___ blockchain technology has ___ potential to revolutionize finance.'", "options": {"A": "The, the", "B": "A, the", "C": "No article, the", "D": "The, a"}, "correct_answer": "C"},
-                    {"question": "Choose: 'She specializes in ___ development of ___ mobile applications.'", "options": {"A": "a, the", "B": "the, no article", "C": "a, no article", "D": "the, the"}, "correct_answer": "B"},
-                    {"question": "Select: '___ cloud computing has changed ___ way we store data.'", "options": {"A": "The, the", "B": "A, the", "C": "No article, the", "D": "The, a"}, "correct_answer": "C"},
-                    {"question": "Which: 'He earned ___ master's degree in ___ data science.'", "options": {"A": "a, the", "B": "a, no article", "C": "the, the", "D": "an, no article"}, "correct_answer": "B"},
-                    {"question": "Choose: '___ Internet of Things connects ___ everyday objects.'", "options": {"A": "An, the", "B": "The, no article", "C": "A, the", "D": "The, the"}, "correct_answer": "B"},
-                    {"question": "Select: 'She works on ___ cutting-edge research in ___ quantum computing.'", "options": {"A": "a, the", "B": "the, no article", "C": "a, no article", "D": "no article, no article"}, "correct_answer": "D"},
-                    {"question": "Which: '___ virtual reality is transforming ___ entertainment industry.'", "options": {"A": "The, the", "B": "A, the", "C": "No article, the", "D": "The, an"}, "correct_answer": "C"},
-                    {"question": "Choose: 'He has ___ expertise in ___ field of robotics.'", "options": {"A": "an, a", "B": "no article, the", "C": "the, the", "D": "a, a"}, "correct_answer": "B"},
-                    {"question": "Select: '___ big data analytics requires ___ understanding of statistics.'", "options": {"A": "The, an", "B": "A, an", "C": "No article, an", "D": "The, the"}, "correct_answer": "C"},
-                    {"question": "Which: 'She leads ___ team working on ___ next generation of processors.'", "options": {"A": "a, a", "B": "the, the", "C": "a, the", "D": "the, a"}, "correct_answer": "C"}
-                ]
-            },
-            'prepositions': {
-                'easy': [
-                    {"question": "Complete: 'I work ___ a tech company.'", "options": {"A": "in", "B": "at", "C": "on", "D": "for"}, "correct_answer": "B"},
-                    {"question": "Fill in the blank: 'The meeting is ___ 3 PM.'", "options": {"A": "in", "B": "at", "C": "on", "D": "for"}, "correct_answer": "B"},
-                    {"question": "Choose the right preposition: 'She works ___ the development team.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "D"},
-                    {"question": "Select: 'We'll meet ___ the office.'", "options": {"A": "in", "B": "at", "C": "on", "D": "by"}, "correct_answer": "B"},
-                    {"question": "Which: 'The project starts ___ Monday.'", "options": {"A": "in", "B": "at", "C": "on", "D": "by"}, "correct_answer": "C"},
-                    {"question": "Choose: 'I live ___ New York.'", "options": {"A": "in", "B": "at", "C": "on", "D": "by"}, "correct_answer": "A"},
-                    {"question": "Select: 'She sits ___ her desk.'", "options": {"A": "in", "B": "at", "C": "on", "D": "by"}, "correct_answer": "B"},
-                    {"question": "Which: 'The book is ___ the table.'", "options": {"A": "in", "B": "at", "C": "on", "D": "by"}, "correct_answer": "C"},
-                    {"question": "Choose: 'We travel ___ car.'", "options": {"A": "in", "B": "at", "C": "on", "D": "by"}, "correct_answer": "D"},
-                    {"question": "Select: 'The meeting is ___ the morning.'", "options": {"A": "in", "B": "at", "C": "on", "D": "by"}, "correct_answer": "A"},
-                    {"question": "Which: 'She works ___ Google.'", "options": {"A": "in", "B": "at", "C": "on", "D": "for"}, "correct_answer": "B"},
-                    {"question": "Choose: 'The code runs ___ the server.'", "options": {"A": "in", "B": "at", "C": "on", "D": "by"}, "correct_answer": "C"},
-                    {"question": "Select: 'I'll call you ___ the evening.'", "options": {"A": "in", "B": "at", "C": "on", "D": "by"}, "correct_answer": "A"},
-                    {"question": "Which: 'The app works ___ mobile devices.'", "options": {"A": "in", "B": "at", "C": "on", "D": "by"}, "correct_answer": "C"},
-                    {"question": "Choose: 'We collaborate ___ other teams.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "D"}
-                ],
-                'medium': [
-                    {"question": "Which preposition fits: 'The team worked ___ the deadline.'", "options": {"A": "in", "B": "on", "C": "at", "D": "towards"}, "correct_answer": "D"},
-                    {"question": "Select the correct preposition: 'We focus ___ quality code.'", "options": {"A": "in", "B": "on", "C": "at", "D": "with"}, "correct_answer": "B"},
-                    {"question": "Choose: 'She specializes ___ web development.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "A"},
-                    {"question": "Which: 'The project depends ___ client approval.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Select: 'We're working ___ a tight schedule.'", "options": {"A": "under", "B": "at", "C": "on", "D": "with"}, "correct_answer": "A"},
-                    {"question": "Choose: 'The team consists ___ five developers.'", "options": {"A": "in", "B": "of", "C": "on", "D": "with"}, "correct_answer": "B"},
-                    {"question": "Which: 'She's responsible ___ testing.'", "options": {"A": "in", "B": "at", "C": "for", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Select: 'We're looking ___ a solution.'", "options": {"A": "in", "B": "at", "C": "for", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Choose: 'The code is based ___ Python.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Which: 'She's interested ___ machine learning.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "A"},
-                    {"question": "Select: 'We're dealing ___ a complex issue.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "D"},
-                    {"question": "Choose: 'The system runs ___ Linux.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Which: 'She's good ___ problem solving.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "B"},
-                    {"question": "Select: 'We're working ___ the latest version.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "D"},
-                    {"question": "Choose: 'The feature is available ___ premium users.'", "options": {"A": "for", "B": "at", "C": "on", "D": "with"}, "correct_answer": "A"}
-                ],
-                'hard': [
-                    {"question": "Select the correct preposition: 'Success depends ___ effective communication.'", "options": {"A": "in", "B": "on", "C": "at", "D": "with"}, "correct_answer": "B"},
-                    {"question": "Choose: 'The algorithm is capable ___ processing large datasets.'", "options": {"A": "in", "B": "at", "C": "of", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Which: 'She's proficient ___ multiple programming languages.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "A"},
-                    {"question": "Select: 'The system is vulnerable ___ security attacks.'", "options": {"A": "for", "B": "at", "C": "to", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Choose: 'We're committed ___ delivering quality software.'", "options": {"A": "in", "B": "at", "C": "to", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Which: 'The framework is compatible ___ various platforms.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "D"},
-                    {"question": "Select: 'She's experienced ___ agile methodologies.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "A"},
-                    {"question": "Choose: 'The code is susceptible ___ memory leaks.'", "options": {"A": "for", "B": "at", "C": "to", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Which: 'We're striving ___ excellence in development.'", "options": {"A": "in", "B": "at", "C": "for", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Select: 'The application is optimized ___ mobile devices.'", "options": {"A": "in", "B": "at", "C": "on", "D": "for"}, "correct_answer": "D"},
-                    {"question": "Choose: 'She's adept ___ handling complex algorithms.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "B"},
-                    {"question": "Which: 'The system is resilient ___ failures.'", "options": {"A": "for", "B": "at", "C": "to", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Select: 'We're focused ___ improving user experience.'", "options": {"A": "in", "B": "at", "C": "on", "D": "with"}, "correct_answer": "C"},
-                    {"question": "Choose: 'The database is optimized ___ performance.'", "options": {"A": "in", "B": "at", "C": "on", "D": "for"}, "correct_answer": "D"},
-                    {"question": "Which: 'She's knowledgeable ___ cloud computing technologies.'", "options": {"A": "in", "B": "about", "C": "on", "D": "with"}, "correct_answer": "B"}
-                ]
-            }
-        }
-        
-        questions = []
-        
-        for topic in topics:
-            if topic in grammar_templates:
-                topic_config = topic_questions.get(topic, {})
-                
-                # Generate questions for each difficulty
-                for difficulty in ['easy', 'medium', 'hard']:
-                    count = topic_config.get(difficulty, 0)
-                    templates = grammar_templates[topic].get(difficulty, [])
-                    
-                    for i in range(count):
-                        template_index = i % len(templates) if templates else 0
-                        if templates:
-                            template = templates[template_index]
-                            time_limit = 60 if difficulty == 'easy' else 90 if difficulty == 'medium' else 120
-                            
-                            questions.append({
-                                'title': f'Grammar Assessment - {topic.title()} {difficulty.title()} {i+1}',
-                                'content': template['question'],
-                                'options': template['options'],
-                                'correct_answer': template['correct_answer'],
-                                'skill': 'grammar',
-                                'type': 'grammar',
-                                'topic': topic,
-                                'difficulty': difficulty,
-                                'time_limit': time_limit,
-                                'evaluation_criteria': ['grammatical_accuracy', 'language_knowledge'],
-                                'instructions': 'Select the most grammatically correct option.'
-                            })
+        # Topics without templates produce nothing - drop them before reading counts or keying the cache
+        topic_counts = tuple(
+            (topic, *(topic_questions.get(topic, {}).get(difficulty, 0) for difficulty in ('easy', 'medium', 'hard')))
+            for topic in grammar_config.get('topics', []) if topic in _grammar_templates()
+        )
+        # Copies (options included) so callers can't modify the cached dicts or the shared templates
+        questions = [
+            {**question, 'options': dict(question['options'])}
+            for question in self._grammar_template_questions(topic_counts)
+        ]
         
         logger.info(f"✅ Generated {len(questions)} grammar questions using templates")
         return questions
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _grammar_template_questions(topic_counts: Tuple[Tuple[str, int, int, int], ...]) -> Tuple[Dict, ...]:
+        """Grammar template questions for (topic, easy, medium, hard) counts (cached - the templates are static)"""
+        templates = _grammar_templates_flat()
+        
+        # Invariant fields come from per-difficulty prototypes; only the title number, question and topic vary.
+        # Title prefixes are formatted once per topic/difficulty group rather than per question.
+        return tuple(
+            {
+                **_GRAMMAR_TEMPLATE_PROTOTYPES[difficulty],
+                'title': title_prefix + str(i),
+                'content': template['question'],
+                'options': template['options'],
+                'correct_answer': template['correct_answer'],
+                'topic': topic
+            }
+            for topic, *counts in topic_counts
+            for difficulty, count in zip(('easy', 'medium', 'hard'), counts)
+            for title_prefix in (f'Grammar Assessment - {topic.title()} {difficulty.title()} ',)
+            for i, template in enumerate(islice(cycle(templates.get((topic, difficulty), ())), count), 1)
+        )
+
     def _generate_small_reading_batch(self, reading_config: Dict, job_title: str, max_questions: int, existing_questions: List[Dict] = None) -> List[Dict]:
         """Generate a small batch of reading questions with AI + template fallback"""
         questions_to_generate = min(max_questions, 3)  # Max 3 reading questions per batch
@@ -1355,36 +1169,34 @@ Requirements:
 - Use professional, clear language
 - Make each passage completely unique and different
 
-Return ONLY a JSON array of passages like this:
-[
-  "First unique passage about software development work and best practices...",
-  "Second completely different passage about project management and teamwork...",
-  "Third unique passage about technical problem-solving approaches..."
-]"""
+Return ONLY a JSON object with a "questions" array of passages like this:
+{{
+  "questions": [
+    "First unique passage about software development work and best practices...",
+    "Second completely different passage about project management and teamwork...",
+    "Third unique passage about technical problem-solving approaches..."
+  ]
+}}"""
 
             try:
-                response = requests.post(
-                    f"{self.api_base}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.get_current_api_key()}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
+                response = self._post_chat_completion(
+                    {
                         "model": self.model,
                         "messages": [
-                            {"role": "system", "content": "You are an expert assessment creator. Generate unique reading passages in valid JSON format only."},
+                            _READING_SMALL_BATCH_SYSTEM_MESSAGE,
                             {"role": "user", "content": prompt}
                         ],
                         "temperature": 0.8,
-                        "max_tokens": 1000
+                        "max_tokens": 1000,
+                        "response_format": {"type": "json_object"}
                     },
                     timeout=30
                 )
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = orjson.loads(response.content)
                     content = result['choices'][0]['message']['content'].strip()
-                    passages = json.loads(content)
+                    passages = _extract_questions(content)
                     
                     questions = []
                     for i, passage in enumerate(passages[:questions_to_generate]):
@@ -1396,12 +1208,14 @@ Return ONLY a JSON array of passages like this:
                             'type': 'reading_aloud',
                             'difficulty': 'medium',
                             'time_limit': 180,
-                            'evaluation_criteria': ['pronunciation', 'fluency', 'pace', 'clarity'],
+                            'evaluation_criteria': _READ_CRITERIA,
                             'instructions': 'Read the paragraph aloud at a natural pace.'
                         })
                     
-                    logger.info(f"✅ AI generated {len(questions)} reading passages")
-                    return questions
+                    if questions:
+                        logger.info(f"✅ AI generated {len(questions)} reading passages")
+                        return questions
+                    logger.warning("⚠️ AI response had no usable passages")
                     
             except Exception as e:
                 logger.warning(f"⚠️ AI generation failed: {str(e)}")
@@ -1458,7 +1272,7 @@ Return ONLY a JSON array of passages like this:
                     'type': 'reading_aloud',
                     'difficulty': 'medium',
                     'time_limit': 180,
-                    'evaluation_criteria': ['pronunciation', 'fluency', 'pace', 'clarity'],
+                    'evaluation_criteria': _READ_CRITERIA,
                     'instructions': 'Read the paragraph aloud at a natural pace.'
                 })
                 existing_passages.add(passage_key)  # Add to prevent duplicates in this batch
@@ -1489,7 +1303,7 @@ Return ONLY a JSON array of passages like this:
                         'type': 'reading_aloud',
                         'difficulty': 'medium',
                         'time_limit': 180,
-                        'evaluation_criteria': ['pronunciation', 'fluency', 'pace', 'clarity'],
+                        'evaluation_criteria': _READ_CRITERIA,
                         'instructions': 'Read the paragraph aloud at a natural pace.'
                     })
                     existing_passages.add(passage_key)
@@ -1504,9 +1318,7 @@ Return ONLY a JSON array of passages like this:
             logger.warning(f"🚨 Still need {remaining_needed} questions after template exhaustion - generating dynamic variations")
             
             # Generate dynamic variations of existing templates
-            for i in range(remaining_needed):
-                base_template_index = i % len(reading_templates)
-                base_passage = reading_templates[base_template_index]
+            for i, base_passage in enumerate(islice(cycle(reading_templates), remaining_needed)):
                 
                 # Create variation by modifying the passage slightly
                 variation_passage = self._create_reading_variation(base_passage, job_title, i + 1)
@@ -1519,7 +1331,7 @@ Return ONLY a JSON array of passages like this:
                     'type': 'reading_aloud',
                     'difficulty': 'medium',
                     'time_limit': 180,
-                    'evaluation_criteria': ['pronunciation', 'fluency', 'pace', 'clarity'],
+                    'evaluation_criteria': _READ_CRITERIA,
                     'instructions': 'Read the paragraph aloud at a natural pace.'
                 })
                 generated_count += 1
@@ -1545,36 +1357,34 @@ Requirements:
 - Use professional, clear language
 - Make each sentence completely unique and different
 
-Return ONLY a JSON array of sentences like this:
-[
-  "First unique sentence about software development processes and methodologies.",
-  "Second different sentence about team collaboration and project management.",
-  "Third unique sentence about technical problem-solving and code quality."
-]"""
+Return ONLY a JSON object with a "questions" array of sentences like this:
+{{
+  "questions": [
+    "First unique sentence about software development processes and methodologies.",
+    "Second different sentence about team collaboration and project management.",
+    "Third unique sentence about technical problem-solving and code quality."
+  ]
+}}"""
 
             try:
-                response = requests.post(
-                    f"{self.api_base}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.get_current_api_key()}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
+                response = self._post_chat_completion(
+                    {
                         "model": self.model,
                         "messages": [
-                            {"role": "system", "content": "You are an expert assessment creator. Generate unique listening sentences in valid JSON format only."},
+                            _LISTENING_SMALL_BATCH_SYSTEM_MESSAGE,
                             {"role": "user", "content": prompt}
                         ],
                         "temperature": 0.8,
-                        "max_tokens": 500
+                        "max_tokens": 500,
+                        "response_format": {"type": "json_object"}
                     },
                     timeout=30
                 )
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = orjson.loads(response.content)
                     content = result['choices'][0]['message']['content'].strip()
-                    sentences = json.loads(content)
+                    sentences = _extract_questions(content)
                     
                     questions = []
                     for i, sentence in enumerate(sentences[:questions_to_generate]):
@@ -1587,12 +1397,14 @@ Return ONLY a JSON array of sentences like this:
                             'type': 'listening',
                             'difficulty': 'medium',
                             'time_limit': 90,
-                            'evaluation_criteria': ['accuracy', 'pronunciation', 'fluency'],
+                            'evaluation_criteria': _LISTEN_CRITERIA,
                             'instructions': 'Listen carefully, then repeat exactly as you heard it.'
                         })
                     
-                    logger.info(f"✅ AI generated {len(questions)} listening sentences")
-                    return questions
+                    if questions:
+                        logger.info(f"✅ AI generated {len(questions)} listening sentences")
+                        return questions
+                    logger.warning("⚠️ AI response had no usable sentences")
                     
             except Exception as e:
                 logger.warning(f"⚠️ AI generation failed: {str(e)}")
@@ -1641,7 +1453,7 @@ Return ONLY a JSON array of sentences like this:
                     'type': 'listening',
                     'difficulty': 'medium',
                     'time_limit': 90,
-                    'evaluation_criteria': ['accuracy', 'pronunciation', 'fluency'],
+                    'evaluation_criteria': _LISTEN_CRITERIA,
                     'instructions': 'Listen carefully, then repeat exactly as you heard it.'
                 })
                 existing_sentences.add(sentence)  # Add to prevent duplicates in this batch
@@ -1658,9 +1470,7 @@ Return ONLY a JSON array of sentences like this:
             logger.warning(f"🚨 Still need {remaining_needed} listening questions after template exhaustion - generating dynamic variations")
             
             # Generate dynamic variations of existing templates
-            for i in range(remaining_needed):
-                base_template_index = i % len(listening_templates)
-                base_sentence = listening_templates[base_template_index]
+            for i, base_sentence in enumerate(islice(cycle(listening_templates), remaining_needed)):
                 
                 # Create variation by modifying the sentence slightly
                 variation_sentence = self._create_listening_variation(base_sentence, job_title, i + 1)
@@ -1674,7 +1484,7 @@ Return ONLY a JSON array of sentences like this:
                     'type': 'listening',
                     'difficulty': 'medium',
                     'time_limit': 90,
-                    'evaluation_criteria': ['accuracy', 'pronunciation', 'fluency'],
+                    'evaluation_criteria': _LISTEN_CRITERIA,
                     'instructions': 'Listen carefully, then repeat exactly as you heard it.'
                 })
                 generated_count += 1
@@ -1700,43 +1510,41 @@ Requirements:
 - Provide 4 options (A, B, C, D) for each question
 - Make each question completely unique and different
 
-Return ONLY a JSON array like this:
-[
-  {{
-    "question": "Which sentence uses the correct present perfect tense?",
-    "options": {{
-      "A": "I have completed the project yesterday.",
-      "B": "I completed the project yesterday.", 
-      "C": "I have completed the project.",
-      "D": "I am completing the project yesterday."
-    }},
-    "correct_answer": "C"
-  }}
-]"""
+Return ONLY a JSON object with a "questions" array like this:
+{{
+  "questions": [
+    {{
+      "question": "Which sentence uses the correct present perfect tense?",
+      "options": {{
+        "A": "I have completed the project yesterday.",
+        "B": "I completed the project yesterday.", 
+        "C": "I have completed the project.",
+        "D": "I am completing the project yesterday."
+      }},
+      "correct_answer": "C"
+    }}
+  ]
+}}"""
 
             try:
-                response = requests.post(
-                    f"{self.api_base}/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.get_current_api_key()}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
+                response = self._post_chat_completion(
+                    {
                         "model": self.model,
                         "messages": [
-                            {"role": "system", "content": "You are an expert grammar assessment creator. Generate unique grammar questions in valid JSON format only."},
+                            _GRAMMAR_SMALL_BATCH_SYSTEM_MESSAGE,
                             {"role": "user", "content": prompt}
                         ],
                         "temperature": 0.7,
-                        "max_tokens": 1500
+                        "max_tokens": 1500,
+                        "response_format": {"type": "json_object"}
                     },
                     timeout=30
                 )
                 
                 if response.status_code == 200:
-                    result = response.json()
+                    result = orjson.loads(response.content)
                     content = result['choices'][0]['message']['content'].strip()
-                    questions_data = json.loads(content)
+                    questions_data = _extract_questions(content)
                     
                     questions = []
                     for i, q_data in enumerate(questions_data[:questions_to_generate]):
@@ -1750,12 +1558,14 @@ Return ONLY a JSON array like this:
                             'topic': 'mixed',
                             'difficulty': 'medium',
                             'time_limit': 90,
-                            'evaluation_criteria': ['grammatical_accuracy', 'language_knowledge'],
+                            'evaluation_criteria': _GRAMMAR_CRITERIA,
                             'instructions': 'Select the most grammatically correct option.'
                         })
                     
-                    logger.info(f"✅ AI generated {len(questions)} grammar questions")
-                    return questions
+                    if questions:
+                        logger.info(f"✅ AI generated {len(questions)} grammar questions")
+                        return questions
+                    logger.warning("⚠️ AI response had no usable questions")
                     
             except Exception as e:
                 logger.warning(f"⚠️ AI generation failed: {str(e)}")
@@ -1874,7 +1684,7 @@ Return ONLY a JSON array like this:
                     'topic': 'mixed',
                     'difficulty': 'medium',
                     'time_limit': 90,
-                    'evaluation_criteria': ['grammatical_accuracy', 'language_knowledge'],
+                    'evaluation_criteria': _GRAMMAR_CRITERIA,
                     'instructions': 'Select the most grammatically correct option.'
                 })
                 existing_question_texts.add(question_text)  # Add to prevent duplicates in this batch
@@ -1891,9 +1701,7 @@ Return ONLY a JSON array like this:
             logger.warning(f"🚨 Still need {remaining_needed} grammar questions after template exhaustion - generating dynamic variations")
             
             # Generate dynamic variations of existing templates
-            for i in range(remaining_needed):
-                base_template_index = i % len(grammar_templates)
-                base_question = grammar_templates[base_template_index]
+            for i, base_question in enumerate(islice(cycle(grammar_templates), remaining_needed)):
                 
                 # Create variation by modifying the question slightly
                 variation_question = self._create_grammar_variation(base_question, i + 1)
@@ -1908,7 +1716,7 @@ Return ONLY a JSON array like this:
                     'topic': 'mixed',
                     'difficulty': 'medium',
                     'time_limit': 90,
-                    'evaluation_criteria': ['grammatical_accuracy', 'language_knowledge'],
+                    'evaluation_criteria': _GRAMMAR_CRITERIA,
                     'instructions': 'Select the most grammatically correct option.'
                 })
                 generated_count += 1
@@ -2157,53 +1965,20 @@ Generate exactly {total_questions} questions following the topic and difficulty
         try:
             logger.info(f"🚀 Making single API call for all {total_questions} questions...")
             
-            # API key rotation with retry logic
-            max_key_attempts = len(self.api_keys)
-            max_retries_per_key = 2
-            
-            for key_attempt in range(max_key_attempts):
-                current_api_key = self.get_current_api_key()
-                logger.info(f"🔑 Using API key {self.current_key_index + 1}/{len(self.api_keys)}")
-                
-                for retry in range(max_retries_per_key):
-                    response = requests.post(
-                        "https://api.groq.com/openai/v1/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {current_api_key}",
-                            "Content-Type": "application/json"
-                        },
-                        json={
-                            "model": self.model,
-                            "messages": [
-                                {"role": "system", "content": "You are an expert aptitude test creator. Generate professional MCQ questions in valid JSON format only. Follow the exact count and difficulty requirements for each topic. Keep responses concise."},
-                                {"role": "user", "content": prompt}
-                            ],
-                            "temperature": 0.7,
-                            "max_tokens": 6000  # Reduced to prevent truncation
-                        },
-                        timeout=120  # Longer timeout for larger request
-                    )
-                    
-                    if response.status_code == 429:
-                        if retry < max_retries_per_key - 1:
-                            retry_delay = 5 * (retry + 1)  # 5s, 10s delays
-                            logger.warning(f"⚠️ Rate limited (429) on key {self.current_key_index + 1}, retrying in {retry_delay}s... (attempt {retry + 1}/{max_retries_per_key})")
-                            time.sleep(retry_delay)
-                            continue
-                        else:
-                            # This key is rate limited, try next key
-                            logger.warning(f"⚠️ Key {self.current_key_index + 1} rate limited, rotating to next key...")
-                            if not self.rotate_api_key():
-                                # No more keys to rotate to
-                                break
-                            break  # Break retry loop, continue with next key
-                    else:
-                        # Success or other error, exit all loops
-                        break
-                
-                # If we got a non-429 response, break out of key rotation loop
-                if response.status_code != 429:
-                    break
+            # Goes through the shared limiter like every other call: it picks a key with RPM/TPM headroom
+            # and moves to the next key on a 429 instead of sleeping on this one
+            response = self._post_chat_completion(
+                {
+                    "model": self.model,
+                    "messages": [
+                        {"role": "system", "content": "You are an expert aptitude test creator. Generate professional MCQ questions in valid JSON format only. Follow the exact count and difficulty requirements for each topic. Keep responses concise."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "temperature": 0.7,
+                    "max_tokens": 6000  # Reduced to prevent truncation
+                },
+                timeout=120  # Longer timeout for larger request
+            )
             
             # If all keys are rate limited
             if response.status_code == 429:
@@ -2212,7 +1987,7 @@ Generate exactly {total_questions} questions following the topic and difficulty
                 return self._get_fallback_aptitude_questions(topic_configs, time_per_question, job_title)
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 content = result['choices'][0]['message']['content'].strip()
                 
                 # Debug logging
@@ -2246,9 +2021,15 @@ Generate exactly {total_questions} questions following the topic and difficulty
                 logger.info(f"🧹 Cleaned content preview: {content[:200]}...")
 
                 try:
-                    questions_data = json.loads(content)
+                    questions_data = orjson.loads(content)
                     generated_questions = questions_data.get('questions', [])
                     
+                    # Report (but keep) exact repeats of stored questions - dropping them would leave the
+                    # assessment short of the requested count with nothing to fill the gap
+                    duplicate_count = sum(1 for q in generated_questions if self._is_duplicate(q.get('topic', ''), q.get('question', '')))
+                    if duplicate_count:
+                        logger.warning(f"⚠️ {duplicate_count} generated questions repeat existing ones")
+                    
                     # Validate exact count - trim if too many, warn if too few
                     if len(generated_questions) > total_questions:
                         logger.warning(f"⚠️ AI generated {len(generated_questions)} questions, expected {total_questions}. Trimming to exact count.")
@@ -2343,11 +2124,6 @@ Generate exactly {total_questions} questions following the topic and difficulty
                 logger.info(f"✅ Batch {i//batch_size + 1}: Generated {len(batch_result['questions'])} questions")
             else:
                 logger.error(f"❌ Batch {i//batch_size + 1} failed")
-            
-            # Add delay between batches to avoid rate limiting
-            if i + batch_size < len(topic_configs):
-                logger.info("⏳ Waiting 3 seconds before next batch...")
-                time.sleep(3)
         
         if all_questions:
             logger.info(f"🎉 Successfully generated {len(all_questions)} total aptitude questions from {len(topic_configs)} topics")
@@ -2418,15 +2194,8 @@ REQUIREMENTS:
 Generate exactly {batch_total} questions following the topic and difficulty distribution above."""
 
         try:
-            current_api_key = self.get_current_api_key()
-            
-            response = requests.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {current_api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
+            response = self._post_chat_completion(
+                {
                     "model": self.model,
                     "messages": [
                         {"role": "system", "content": "You are an expert aptitude test creator. Generate professional MCQ questions in valid JSON format only. Follow the exact count and difficulty requirements for each topic. Keep responses concise."},
@@ -2439,7 +2208,7 @@ Generate exactly {batch_total} questions following the topic and difficulty dist
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 content = result['choices'][0]['message']['content'].strip()
                 
                 # Clean markdown code blocks
@@ -2450,7 +2219,7 @@ Generate exactly {batch_total} questions following the topic and difficulty dist
                 content = content.strip()
                 
                 try:
-                    questions_data = json.loads(content)
+                    questions_data = orjson.loads(content)
                     generated_questions = questions_data.get('questions', [])
                     
                     # Validate exact count - trim if too many, warn if too few
@@ -2471,8 +2240,8 @@ Generate exactly {batch_total} questions following the topic and difficulty dist
                     return {'success': False, 'questions': []}
                     
             elif response.status_code == 429:
-                logger.warning("⚠️ Rate limited in batch, rotating API key...")
-                self.rotate_api_key()
+                # _post_chat_completion already put every key it tried on cooldown
+                logger.warning("⚠️ Rate limited in batch on every available API key")
                 return {'success': False, 'questions': []}
             else:
                 logger.error(f"❌ Batch API error: {response.status_code}")
@@ -2534,13 +2303,8 @@ Return ONLY a JSON object in this exact format:
   "metadata": {{"topics": "{topics_str}", "generated_by": "groq"}}
 }}"""
 
-            response = requests.post(
-                f"{self.api_base}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.get_current_api_key()}",
-                    "Content-Type": "application/json"
-                },
-                json={
+            response = self._post_chat_completion(
+                {
                     "model": self.model,
                     "messages": [
                         {"role": "system", "content": "You are an expert aptitude test creator. Generate professional MCQ questions in valid JSON format only. Follow the exact count requirements."},
@@ -2553,9 +2317,9 @@ Return ONLY a JSON object in this exact format:
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 content = result['choices'][0]['message']['content'].strip()
-                questions_data = json.loads(content)
+                questions_data = orjson.loads(content)
                 
                 generated_count = len(questions_data.get('questions', []))
                 if generated_count != total_questions:
@@ -2669,13 +2433,8 @@ Return ONLY a JSON object in this exact format:
 }}"""
 
         try:
-            response = requests.post(
-                f"{self.api_base}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {self.get_current_api_key()}",
-                    "Content-Type": "application/json"
-                },
-                json={
+            response = self._post_chat_completion(
+                {
                     "model": self.model,
                     "messages": [
                         {"role": "system", "content": "You are an expert aptitude test creator. Generate professional MCQ questions in valid JSON format only."},
@@ -2688,9 +2447,9 @@ Return ONLY a JSON object in this exact format:
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content)
                 content = result['choices'][0]['message']['content']
-                questions_data = json.loads(content)
+                questions_data = orjson.loads(content)
                 
                 logger.info(f"✅ Generated {len(questions_data.get('questions', []))} aptitude questions")
                 return {'success': True, **questions_data}
@@ -2717,133 +2476,6 @@ Return ONLY a JSON object in this exact format:
             return self._get_fallback_aptitude_questions(topic_configs, time_per_question, job_title)
 
     def _get_fallback_aptitude_questions(self, topic_configs: List[Dict], time_per_question: int = 60, job_title: str = 'Software Developer') -> Dict[str, Any]:
-        """Generate fallback aptitude questions using comprehensive templates with 20+ unique questions per topic/difficulty"""
-        logger.info(f"📝 Using fallback templates for aptitude questions...")
-        
-        # Comprehensive question templates - 20 unique questions per topic per difficulty
-        fallback_templates = {
-            'logical_reasoning': {
-                'easy': [
-                    {'question': 'If all developers use Git and John is a developer, what can we conclude?', 'options': {'A': 'John uses Git', 'B': 'John uses SVN', 'C': 'John uses CVS', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'If all developers use Git and John is a developer, then John must use Git.'},
-                    {'question': 'In a sequence: 2, 4, 8, 16, ?, what comes next?', 'options': {'A': '24', 'B': '32', 'C': '20', 'D': '18'}, 'correct_answer': 'B', 'explanation': 'Each number is doubled: 2×2=4, 4×2=8, 8×2=16, 16×2=32.'},
-                    {'question': 'If it takes 5 developers 10 days to complete a project, how many days would it take 10 developers?', 'options': {'A': '20 days', 'B': '5 days', 'C': '15 days', 'D': '2 days'}, 'correct_answer': 'B', 'explanation': 'With double the developers, the work takes half the time: 10÷2=5 days.'},
-                    {'question': 'Which number does not belong: 3, 5, 7, 9, 11?', 'options': {'A': '3', 'B': '5', 'C': '9', 'D': '11'}, 'correct_answer': 'C', 'explanation': '9 is not a prime number (3×3=9), while others are prime numbers.'},
-                    {'question': 'Complete the pattern: AB, CD, EF, ?', 'options': {'A': 'GH', 'B': 'HI', 'C': 'FG', 'D': 'IJ'}, 'correct_answer': 'A', 'explanation': 'Each pair consists of consecutive letters: AB, CD, EF, GH.'},
-                    {'question': 'What comes next: 1, 1, 2, 3, 5, 8, ?', 'options': {'A': '11', 'B': '13', 'C': '15', 'D': '10'}, 'correct_answer': 'B', 'explanation': 'Fibonacci sequence: each number is sum of previous two (5+8=13).'},
-                    {'question': 'Which is the odd one out: HTTP, FTP, TCP, HTML?', 'options': {'A': 'HTTP', 'B': 'FTP', 'C': 'TCP', 'D': 'HTML'}, 'correct_answer': 'D', 'explanation': 'HTML is a markup language, while others are protocols.'},
-                    {'question': 'Complete the series: 5, 10, 20, 40, ?', 'options': {'A': '60', 'B': '80', 'C': '70', 'D': '90'}, 'correct_answer': 'B', 'explanation': 'Each number is doubled: 5×2=10, 10×2=20, 20×2=40, 40×2=80.'},
-                    {'question': 'If A > B and B > C, what is the relationship between A and C?', 'options': {'A': 'A > C', 'B': 'A < C', 'C': 'A = C', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Transitive property: if A > B and B > C, then A > C.'},
-                    {'question': 'What is the next number: 1, 4, 9, 16, ?', 'options': {'A': '20', 'B': '25', 'C': '24', 'D': '30'}, 'correct_answer': 'B', 'explanation': 'Perfect squares: 1², 2², 3², 4², 5² = 25.'},
-                    {'question': 'In binary, what is 1010 + 1100?', 'options': {'A': '10110', 'B': '11010', 'C': '10010', 'D': '11100'}, 'correct_answer': 'A', 'explanation': '1010 (10) + 1100 (12) = 10110 (22 in binary).'},
-                    {'question': 'If every bug has a cause and this error is a bug, then:', 'options': {'A': 'This error has a cause', 'B': 'This error has no cause', 'C': 'Some bugs have no cause', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Universal statement: every bug has a cause, this is a bug, so this has a cause.'},
-                    {'question': 'If no developers work on weekends and today is Saturday, then:', 'options': {'A': 'No developers are working today', 'B': 'Some developers are working', 'C': 'All developers are working', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'No developers work weekends, Saturday is weekend, so no developers working.'},
-                    {'question': 'Complete: Circle is to Round as Square is to ?', 'options': {'A': 'Angular', 'B': 'Four-sided', 'C': 'Geometric', 'D': 'Flat'}, 'correct_answer': 'B', 'explanation': 'Circle is characterized by being round, square by being four-sided.'},
-                    {'question': 'In the pattern X, Y, Z, A, B, what comes next?', 'options': {'A': 'C', 'B': 'D', 'C': 'E', 'D': 'F'}, 'correct_answer': 'A', 'explanation': 'Alphabetical sequence continuing: X, Y, Z, A, B, C.'},
-                    {'question': 'If all APIs return JSON and this endpoint is an API, then:', 'options': {'A': 'This endpoint returns JSON', 'B': 'This endpoint returns XML', 'C': 'Some APIs return XML', 'D': 'Cannot determine'}, 'correct_answer': 'A', 'explanation': 'Universal statement about APIs, this is an API, so it returns JSON.'},
-                    {'question': 'What number is missing: 2, 3, 5, 7, 11, ?', 'options': {'A': '13', 'B': '15', 'C': '17', 'D': '19'}, 'correct_answer': 'A', 'explanation': 'Prime number sequence: 2, 3, 5, 7, 11, 13.'},
-                    {'question': 'If debugging takes twice as long as coding, and coding takes 4 hours, how long is debugging?', 'options': {'A': '6 hours', 'B': '8 hours', 'C': '10 hours', 'D': '12 hours'}, 'correct_answer': 'B', 'explanation': 'Debugging = 2 × coding time = 2 × 4 = 8 hours.'},
-                    {'question': 'Complete the analogy: Function is to Code as Chapter is to ?', 'options': {'A': 'Book', 'B': 'Page', 'C': 'Word', 'D': 'Story'}, 'correct_answer': 'A', 'explanation': 'Function is part of code, chapter is part of book.'},
-                    {'question': 'If some programmers are testers and all testers are analysts, then:', 'options': {'A': 'Some programmers are analysts', 'B': 'All programmers are analysts', 'C': 'No programmers are analysts', 'D': 'All analysts are programmers'}, 'correct_answer': 'A', 'explanation': 'Some programmers → testers → analysts, so some programmers are analysts.'}
-                ],
-                'medium': [
-                    {'question': 'In a coding interview, if 40% pass the technical round and 60% of those pass the final round, what percentage pass both?', 'options': {'A': '24%', 'B': '30%', 'C': '36%', 'D': '20%'}, 'correct_answer': 'A', 'explanation': '40% × 60% = 0.4 × 0.6 = 0.24 = 24%'},
-                    {'question': 'If ALGORITHM is coded as DOJRULWKP, how is FUNCTION coded?', 'options': {'A': 'IXQFWLRQ', 'B': 'IXQFWLRO', 'C': 'IXQFWLRP', 'D': 'IXQFWMRQ'}, 'correct_answer': 'A', 'explanation': 'Each letter is shifted by +3 positions in alphabet.'},
-                    {'question': 'A software team has 8 members. In how many ways can they form a subteam of 3 members?', 'options': {'A': '56', 'B': '48', 'C': '64', 'D': '72'}, 'correct_answer': 'A', 'explanation': 'Combination C(8,3) = 8!/(3!×5!) = 56 ways.'},
-                    {'question': 'Complete the series: 2, 6, 12, 20, 30, ?', 'options': {'A': '42', 'B': '40', 'C': '38', 'D': '44'}, 'correct_answer': 'A', 'explanation': 'Pattern: n(n+1) where n=1,2,3,4,5,6. So 6×7=42.'},
-                    {'question': 'If a hash table has load factor 0.75 and 12 elements, what is the table size?', 'options': {'A': '16', 'B': '18', 'C': '20', 'D': '15'}, 'correct_answer': 'A', 'explanation': 'Load factor = elements/size, so 0.75 = 12/size, size = 16.'}
-                ],
-                'hard': [
-                    {'question': 'In a distributed system with 5 nodes, if each node can fail independently with probability 0.1, what is the probability that exactly 2 nodes fail?', 'options': {'A': '0.0729', 'B': '0.0810', 'C': '0.0656', 'D': '0.0590'}, 'correct_answer': 'A', 'explanation': 'Binomial probability: C(5,2) × (0.1)² × (0.9)³ = 10 × 0.01 × 0.729 = 0.0729'},
-                    {'question': 'A recursive algorithm has time complexity T(n) = 2T(n/2) + n. What is its Big O complexity?', 'options': {'A': 'O(n log n)', 'B': 'O(n²)', 'C': 'O(n)', 'D': 'O(log n)'}, 'correct_answer': 'A', 'explanation': 'Using Master Theorem: a=2, b=2, f(n)=n. Since n = n^log₂(2), complexity is O(n log n).'}
-                ]
-            },
-            'quantitative_aptitude': {
-                'easy': [
-                    {'question': 'What is 25% of 80?', 'options': {'A': '20', 'B': '25', 'C': '15', 'D': '30'}, 'correct_answer': 'A', 'explanation': '25% of 80 = 0.25 × 80 = 20'},
-                    {'question': 'If a software license costs $100 and there is a 15% discount, what is the final price?', 'options': {'A': '$85', 'B': '$90', 'C': '$95', 'D': '$80'}, 'correct_answer': 'A', 'explanation': '15% discount means pay 85%. $100 × 0.85 = $85'},
-                    {'question': 'A team completes 3 features per sprint. How many features in 4 sprints?', 'options': {'A': '12', 'B': '10', 'C': '15', 'D': '9'}, 'correct_answer': 'A', 'explanation': '3 features/sprint × 4 sprints = 12 features'},
-                    {'question': 'If 60% of tests pass, and there are 50 tests, how many fail?', 'options': {'A': '20', 'B': '25', 'C': '15', 'D': '30'}, 'correct_answer': 'A', 'explanation': '40% fail: 50 × 0.40 = 20 tests fail'},
-                    {'question': 'What is 3/4 expressed as a percentage?', 'options': {'A': '75%', 'B': '70%', 'C': '80%', 'D': '65%'}, 'correct_answer': 'A', 'explanation': '3/4 = 0.75 = 75%'}
-                ],
-                'medium': [
-                    {'question': 'A server processes 1200 requests per minute. How many requests in 2.5 hours?', 'options': {'A': '180000', 'B': '150000', 'C': '200000', 'D': '160000'}, 'correct_answer': 'A', 'explanation': '2.5 hours = 150 minutes. 1200 × 150 = 180,000 requests'},
-                    {'question': 'If API response time increases by 20% from 100ms, what is the new response time?', 'options': {'A': '120ms', 'B': '125ms', 'C': '115ms', 'D': '130ms'}, 'correct_answer': 'A', 'explanation': '20% increase: 100 + (100 × 0.20) = 120ms'}
-                ],
-                'hard': [
-                    {'question': 'A system has 99.9% uptime. In a year (365 days), how many minutes of downtime is this?', 'options': {'A': '525.6', 'B': '432.5', 'C': '365.2', 'D': '876.0'}, 'correct_answer': 'A', 'explanation': 'Downtime = 0.1% of year = 0.001 × 365 × 24 × 60 = 525.6 minutes'}
-                ]
-            },
-            'verbal_reasoning': {
-                'easy': [
-                    {'question': 'Choose the word most similar to "Debug":', 'options': {'A': 'Fix', 'B': 'Break', 'C': 'Code', 'D': 'Test'}, 'correct_answer': 'A', 'explanation': 'Debug means to find and fix errors, so "Fix" is most similar.'},
-                    {'question': 'What is the opposite of "Compile"?', 'options': {'A': 'Decompile', 'B': 'Execute', 'C': 'Debug', 'D': 'Test'}, 'correct_answer': 'A', 'explanation': 'Compile converts source to machine code, decompile does the reverse.'}
-                ],
-                'medium': [
-                    {'question': 'Complete the analogy: Code is to Program as Ingredient is to ?', 'options': {'A': 'Recipe', 'B': 'Kitchen', 'C': 'Cook', 'D': 'Food'}, 'correct_answer': 'A', 'explanation': 'Code makes up a program, just as ingredients make up a recipe.'}
-                ],
-                'hard': [
-                    {'question': 'If "Optimization improves performance" is true, and "Performance affects user experience" is true, what can we conclude?', 'options': {'A': 'Optimization affects user experience', 'B': 'User experience improves optimization', 'C': 'Performance equals optimization', 'D': 'Cannot determine relationship'}, 'correct_answer': 'A', 'explanation': 'Transitive property: Optimization → Performance → User Experience'}
-                ]
-            }
-        }
-        
-        # Generate questions based on topic_configs
-        all_questions = []
-        
-        for topic_config in topic_configs:
-            topic = topic_config['topic']
-            
-            # Get templates for this topic or create generic ones
-            if topic not in fallback_templates:
-                # Create generic questions for unknown topics
-                base_templates = {
-                    'easy': [
-                        {'question': f'What is a fundamental concept in {topic.replace("_", " ")}?', 'options': {'A': 'Basic principle', 'B': 'Advanced technique', 'C': 'Complex algorithm', 'D': 'Expert method'}, 'correct_answer': 'A', 'explanation': f'This tests basic understanding of {topic.replace("_", " ")}.'},
-                        {'question': f'Which is most important in {topic.replace("_", " ")}?', 'options': {'A': 'Foundation knowledge', 'B': 'Advanced skills', 'C': 'Expert techniques', 'D': 'Complex theories'}, 'correct_answer': 'A', 'explanation': f'Foundation knowledge is most important in {topic.replace("_", " ")}.'}
-                    ] * 10  # Repeat to get 20 questions
-                }
-                topic_templates = base_templates
-            else:
-                topic_templates = fallback_templates[topic]
-            
-            # Generate questions for each difficulty
-            for difficulty in ['easy', 'medium', 'hard']:
-                count = topic_config.get(difficulty, 0)
-                if count > 0:
-                    available_templates = topic_templates.get(difficulty, topic_templates.get('easy', []))
-                    
-                    # Extend templates if needed
-                    while len(available_templates) < count:
-                        available_templates.extend(topic_templates.get(difficulty, topic_templates.get('easy', [])))
-                    
-                    # Select required number of questions
-                    for i in range(count):
-                        template_index = i % len(available_templates)
-                        template = available_templates[template_index]
-                        
-                        # Add variation to avoid exact duplicates
-                        question_text = template['question']
-                        if i >= len(available_templates):
-                            variation_num = (i // len(available_templates)) + 1
-                            question_text = f"[Variation {variation_num}] {question_text}"
-                        
-                        question = {
-                            'topic': topic,
-                            'question': question_text,
-                            'options': template['options'].copy(),
-                            'correct_answer': template['correct_answer'],
-                            'difficulty': difficulty,
-                            'explanation': template['explanation'],
-                            'time_limit': time_per_question
-                        }
-                        all_questions.append(question)
-        
-        logger.info(f"✅ Generated {len(all_questions)} fallback aptitude questions")
-        
-        return {
-            'success': True,
-            'questions': all_questions,
-            'total_questions': len(all_questions),
-            'metadata': {'generated_by': 'fallback_templates', 'type': 'aptitude_fallback'}
-        }
+        """Generate fallback aptitude questions from the shared template bank in services.aptitude_fallback"""
+        return get_fallback_aptitude_questions(topic_configs, time_per_question, job_title)
 
@@ -0,0 +1,34 @@
+-- Aggregate existing aptitude questions per topic/difficulty on the server
+-- Used by the AI service to count existing questions and build its duplicate-check set
+-- without downloading every question_text
+
+CREATE OR REPLACE FUNCTION get_question_stats(topics TEXT[])
+RETURNS TABLE (
+  topic VARCHAR(100),
+  difficulty VARCHAR(20),
+  cnt BIGINT,
+  hashes TEXT[],
+  samples TEXT[]
+) AS $$
+  SELECT
+    q.topic,
+    q.difficulty,
+    COUNT(*) AS cnt,
+    -- First 8 bytes of sha256 of the canonical text, hex encoded - must match GroqQuestionGenerator._question_digest.
+    -- Canonical form is pinned so it doesn't depend on the database collation: trim exactly the ASCII whitespace
+    -- Python's bytes.strip() removes, and lowercase under COLLATE "C" (ASCII letters only, like bytes.lower()).
+    ARRAY_AGG(ENCODE(SUBSTRING(SHA256(CONVERT_TO(LOWER(BTRIM(q.question_text, E' \t\n\r\x0B\x0C') COLLATE "C"), 'UTF8')) FROM 1 FOR 8), 'hex'))
+      FILTER (WHERE BTRIM(q.question_text, E' \t\n\r\x0B\x0C') <> '') AS hashes,
+    -- A few question texts the AI prompt quotes as examples to avoid
+    (ARRAY_AGG(LOWER(BTRIM(q.question_text, E' \t\r\n'))))[1:3] AS samples
+  FROM aptitude_questions q
+  WHERE q.topic = ANY(topics)
+  GROUP BY q.topic, q.difficulty;
+$$ LANGUAGE sql STABLE;
+
+-- Add comment
+COMMENT ON FUNCTION get_question_stats(TEXT[]) IS 'Per topic/difficulty question counts, text hashes and samples for AI duplicate prevention';
+
+-- Create index for filtering by topic
+CREATE INDEX IF NOT EXISTS idx_aptitude_questions_topic
+ON aptitude_questions(topic);